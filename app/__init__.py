@@ -1,47 +1,58 @@
 __version__ = "0.1.0"
 
+import importlib
+import os
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
+from itsdangerous import URLSafeTimedSerializer
 
 from app.config import Config
+from app.json_provider import OrjsonProvider
 
 db = SQLAlchemy()
 migrate = Migrate()
 login_manager = LoginManager()
 login_manager.login_view = "auth.login"
 
+# (module, url_prefix) for every blueprint; each module exposes ``bp``.
+BLUEPRINTS = [
+    ("app.routes.main", None),
+    ("app.routes.signatures", "/signatures"),
+    ("app.routes.collectors", "/collectors"),
+    ("app.routes.stats", "/stats"),
+    ("app.routes.auth", "/auth"),
+    ("app.routes.settings", "/settings"),
+    ("app.routes.users", "/users"),
+    ("app.routes.organizations", "/organizations"),
+    ("app.routes.imports", "/imports"),
+]
+
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
 
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     login_manager.init_app(app)
 
+    # Signs password-reset tokens; built once instead of per request
+    app.extensions["password_reset_serializer"] = URLSafeTimedSerializer(
+        app.config["SECRET_KEY"], salt="password-reset"
+    )
+
     # Register blueprints
-    from app.routes.main import bp as main_bp
-    from app.routes.signatures import bp as signatures_bp
-    from app.routes.collectors import bp as collectors_bp
-    from app.routes.stats import bp as stats_bp
-    from app.routes.auth import bp as auth_bp
-    from app.routes.settings import bp as settings_bp
-    from app.routes.users import bp as users_bp
-    from app.routes.organizations import bp as organizations_bp
-    from app.routes.imports import bp as imports_bp
-
-    app.register_blueprint(main_bp)
-    app.register_blueprint(signatures_bp, url_prefix="/signatures")
-    app.register_blueprint(collectors_bp, url_prefix="/collectors")
-    app.register_blueprint(stats_bp, url_prefix="/stats")
-    app.register_blueprint(auth_bp, url_prefix="/auth")
-    app.register_blueprint(settings_bp, url_prefix="/settings")
-    app.register_blueprint(users_bp, url_prefix="/users")
-    app.register_blueprint(organizations_bp, url_prefix="/organizations")
-    app.register_blueprint(imports_bp, url_prefix="/imports")
+    for module_name, url_prefix in BLUEPRINTS:
+        module = importlib.import_module(module_name)
+        app.register_blueprint(module.bp, url_prefix=url_prefix)
+
+    register_cli(app)
+    register_query_counter(app)
 
     @app.before_request
     def enforce_password_change():
@@ -70,12 +81,69 @@ def create_app(config_class=Config):
             pass
 
     # Start the backup scheduler (reads schedule setting from DB).
-    # Wrapped in try/except because this runs during `flask db upgrade`
-    # before migrations have created the settings table.
-    try:
-        from app.services.scheduler import init_app as init_scheduler
-        init_scheduler(app)
-    except Exception:
-        pass
+    # Skipped for `flask` CLI commands other than `flask run` (db upgrade,
+    # db-init, ...) so they don't import APScheduler or start background
+    # threads. Wrapped in try/except because the settings table may not
+    # exist yet.
+    if os.environ.get("FLASK_RUN_FROM_CLI") != "true" or _cli_command() == "run":
+        try:
+            from app.services.scheduler import init_app as init_scheduler
+            init_scheduler(app)
+        except Exception:
+            pass
 
     return app
+
+
+def _cli_command() -> str | None:
+    """Return the name of the ``flask`` subcommand loading the app, if known."""
+    import click
+
+    ctx = click.get_current_context(silent=True)
+    return ctx.info_name if ctx else None
+
+
+def register_query_counter(app):
+    """Warn about requests running more than QUERY_COUNT_WARN_THRESHOLD statements."""
+    threshold = app.config.get("QUERY_COUNT_WARN_THRESHOLD")
+    if not threshold:
+        return
+
+    from flask import g, has_request_context, request
+    from sqlalchemy import event
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        # Background threads (imports, backups) have no request to charge
+        if has_request_context():
+            g.query_count = g.get("query_count", 0) + 1
+
+    @app.after_request
+    def warn_on_query_count(response):
+        count = g.get("query_count", 0)
+        if count > threshold:
+            app.logger.warning(
+                "%s %s ran %d SQL statements (threshold %d)",
+                request.method, request.path, count, threshold,
+            )
+        return response
+
+
+def register_cli(app):
+    """Register custom ``flask`` CLI commands."""
+
+    @app.cli.command("db-init")
+    def db_init():
+        """Enable pg_trgm and create all tables on a fresh database.
+
+        Existing databases are managed with ``flask db upgrade`` instead.
+        """
+        from sqlalchemy import text
+
+        db.session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        db.session.commit()
+        db.create_all()
+        print("Database initialized.")
@@ -4,16 +4,54 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _psycopg2_url(url: str) -> str:
+    """Pin the psycopg2 driver, which the engine options below are tuned for.
+
+    SQLAlchemy 2.1 resolves a bare ``postgresql://`` URL to psycopg 3, and
+    does not accept the ``postgres://`` alias some hosts (e.g. Heroku) set.
+    """
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgresql", "postgres"):
+        return "postgresql+psycopg2" + sep + rest
+    return url
+
+
 class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-key-change-me")
-    SQLALCHEMY_DATABASE_URI = os.environ.get(
-        "DATABASE_URL", "postgresql://localhost:5432/mandate"
+    SQLALCHEMY_DATABASE_URI = _psycopg2_url(
+        os.environ.get("DATABASE_URL", "postgresql://localhost:5432/mandate")
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         "connect_args": {"connect_timeout": 5},
+        # Connections are opened lazily, so these are ceilings per process.
+        # LIFO keeps a small set of connections warm; pre-ping discards
+        # connections the server has dropped instead of erroring mid-request.
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+        # Collapse executemany() INSERTs (bulk flushes, voter imports) into
+        # multi-row VALUES statements instead of one round-trip per row.
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+        "executemany_batch_page_size": 500,
     }
 
+    # Backup scheduler: one process per database wins a leader election and
+    # runs scheduled backups. Set RUN_SCHEDULER=0 to opt a process out.
+    RUN_SCHEDULER = os.environ.get("RUN_SCHEDULER", "1") != "0"
+
+    # Commit signature entries with synchronous_commit=off, so data entry
+    # doesn't wait on a WAL flush per signature. A Postgres crash can then
+    # lose the last fraction of a second of entries (never corrupt them).
+    SIGNATURE_ASYNC_COMMIT = os.environ.get("SIGNATURE_ASYNC_COMMIT", "0") == "1"
+
+    # Log requests that run more SQL statements than this, to catch N+1
+    # lazy loads during development. 0 turns the counter off.
+    QUERY_COUNT_WARN_THRESHOLD = int(os.environ.get("QUERY_COUNT_WARN_THRESHOLD", 0))
+
     # Search settings
     SEARCH_RESULTS_LIMIT = 100  # Fewer results = faster response
     SEARCH_SIMILARITY_THRESHOLD = 0.2  # Lower = more results but faster
@@ -21,3 +59,6 @@ class Config:
     # File upload settings
     UPLOAD_FOLDER = os.environ.get("UPLOAD_FOLDER", "/tmp/petition-qc-uploads")
     MAX_CONTENT_LENGTH = 1024 * 1024 * 1024  # 1GB max upload size
+
+    # Built CSV exports, reused until their data changes
+    EXPORT_FOLDER = os.environ.get("EXPORT_FOLDER", "/tmp/petition-qc-exports")
@@ -0,0 +1,23 @@
+"""Helpers shared by Alembic migrations in migrations/versions."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def create_index_concurrently(name: str, on: str, unique: bool = False) -> None:
+    """Build index *name* ``ON`` *on* without blocking writes to the table.
+
+    Must run inside ``op.get_context().autocommit_block()``, since
+    CONCURRENTLY cannot run in a transaction. A failed or cancelled
+    CONCURRENTLY build leaves an invalid index behind, which IF NOT EXISTS
+    would then accept as finished, so such a leftover is dropped first.
+    """
+    invalid = op.get_bind().execute(
+        sa.text('SELECT 1 FROM pg_index WHERE indexrelid = to_regclass(:name) AND NOT indisvalid'),
+        {'name': name},
+    ).first()
+    if invalid:
+        op.execute(f'DROP INDEX CONCURRENTLY {name}')
+    op.execute(
+        f'CREATE {"UNIQUE " if unique else ""}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {on}'
+    )
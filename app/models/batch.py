@@ -7,9 +7,9 @@ class Batch(db.Model):
     __tablename__ = "batches"
 
     id = db.Column(db.Integer, primary_key=True)
-    book_id = db.Column(db.Integer, db.ForeignKey("books.id"), nullable=False)
+    book_id = db.Column(db.Integer, db.ForeignKey("books.id"), nullable=False, index=True)
     book_number = db.Column(db.String(50))
-    collector_id = db.Column(db.Integer, db.ForeignKey("collectors.id"))
+    collector_id = db.Column(db.Integer, db.ForeignKey("collectors.id"), index=True)
     enterer_id = db.Column(db.Integer, db.ForeignKey("users.id"))
     enterer_first = db.Column(db.String(100))
     enterer_last = db.Column(db.String(100))
@@ -17,11 +17,17 @@ class Batch(db.Model):
     date_entered = db.Column(db.Date)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
-    # Relationships
-    book = db.relationship("Book", back_populates="batches")
-    collector = db.relationship("Collector")
-    enterer = db.relationship("User")
+    # Relationships. lazy="raise" makes a per-row access fail loudly instead
+    # of issuing one query per batch; eager-load with selectinload() instead.
+    book = db.relationship("Book", back_populates="batches", lazy="raise")
+    collector = db.relationship("Collector", lazy="raise")
+    enterer = db.relationship("User", lazy="raise")
     signatures = db.relationship("Signature", back_populates="batch")
 
+    __table_args__ = (
+        # Also serves lookups on enterer_id alone
+        db.Index("ix_batches_enterer_date", "enterer_id", "date_entered"),
+    )
+
     def __repr__(self):
         return f"<Batch {self.id} - Book {self.book_number}>"
@@ -1,5 +1,31 @@
+import time
+from typing import NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from app import db
 
+# Cached Collector.choices() result: (expires_at, choices). Collector writes
+# through the ORM clear it; the TTL bounds staleness across workers.
+_CHOICES_CACHE: tuple[float, list["CollectorChoice"]] | None = None
+_CHOICES_CACHE_TTL = 30.0
+
+# Same for Organization.choices(), cleared by Organization writes
+_ORG_CHOICES_CACHE: tuple[float, list["OrganizationChoice"]] | None = None
+
+
+class CollectorChoice(NamedTuple):
+    """A collector as shown in a select box."""
+    id: int
+    display_name: str
+
+
+class OrganizationChoice(NamedTuple):
+    """An organization as shown in a select box."""
+    id: int
+    name: str
+
 
 class Collector(db.Model):
     """Petition signature collectors."""
@@ -18,18 +44,50 @@ class Collector(db.Model):
     books = db.relationship("Book", back_populates="collector")
     organization = db.relationship("Organization", back_populates="collectors")
 
+    __table_args__ = (
+        # Name-ordered listings and select boxes scan this instead of sorting
+        db.Index("ix_collectors_name", "last_name", "first_name"),
+    )
+
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
-    @property
+    @hybrid_property
     def display_name(self):
         return f"{self.last_name}, {self.first_name}"
 
+    @display_name.inplace.expression
+    @classmethod
+    def _display_name_expression(cls):
+        return cls.last_name + ", " + cls.first_name
+
+    @classmethod
+    def choices(cls) -> list[CollectorChoice]:
+        """Return (id, display_name) for every collector, sorted by name (cached)."""
+        global _CHOICES_CACHE
+        if _CHOICES_CACHE and _CHOICES_CACHE[0] > time.monotonic():
+            return _CHOICES_CACHE[1]
+
+        rows = db.session.execute(
+            db.select(cls.id, cls.display_name).order_by(cls.last_name, cls.first_name)
+        ).all()
+        choices = [CollectorChoice(*row) for row in rows]
+        _CHOICES_CACHE = (time.monotonic() + _CHOICES_CACHE_TTL, choices)
+        return choices
+
     def __repr__(self):
         return f"<Collector {self.full_name}>"
 
 
+@event.listens_for(Collector, "after_insert")
+@event.listens_for(Collector, "after_update")
+@event.listens_for(Collector, "after_delete")
+def _invalidate_collector_choices(mapper, connection, target):
+    global _CHOICES_CACHE
+    _CHOICES_CACHE = None
+
+
 class DataEnterer(db.Model):
     """Data entry staff."""
 
@@ -42,6 +100,10 @@ class DataEnterer(db.Model):
     email = db.Column(db.String(120))
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    __table_args__ = (
+        db.Index("ix_data_enterers_name", "last_name", "first_name"),
+    )
+
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
@@ -67,6 +129,24 @@ class Organization(db.Model):
     collectors = db.relationship("Collector", back_populates="organization")
     users = db.relationship("User", back_populates="organization")
 
+    __table_args__ = (
+        # Enforces unique names (routes catch the IntegrityError) and gives
+        # the name-ordered listing its order
+        db.Index("ix_organizations_name", "name", unique=True),
+    )
+
+    @classmethod
+    def choices(cls) -> list[OrganizationChoice]:
+        """Return (id, name) for every organization, sorted by name (cached)."""
+        global _ORG_CHOICES_CACHE
+        if _ORG_CHOICES_CACHE and _ORG_CHOICES_CACHE[0] > time.monotonic():
+            return _ORG_CHOICES_CACHE[1]
+
+        rows = db.session.execute(db.select(cls.id, cls.name).order_by(cls.name)).all()
+        choices = [OrganizationChoice(*row) for row in rows]
+        _ORG_CHOICES_CACHE = (time.monotonic() + _CHOICES_CACHE_TTL, choices)
+        return choices
+
     def __repr__(self):
         return f"<Organization {self.name}>"
 
@@ -83,3 +163,11 @@ class PaidCollector(db.Model):
 
     collector = db.relationship("Collector")
     organization = db.relationship("Organization")
+
+
+@event.listens_for(Organization, "after_insert")
+@event.listens_for(Organization, "after_update")
+@event.listens_for(Organization, "after_delete")
+def _invalidate_organization_choices(mapper, connection, target):
+    global _ORG_CHOICES_CACHE
+    _ORG_CHOICES_CACHE = None
@@ -1,5 +1,20 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+
 from app import db
 
+# Process-local cache of setting values: key -> (expires_at, value).
+# Settings change rarely; the TTL bounds how long another worker's write
+# can go unnoticed, while writes in this process invalidate immediately.
+_CACHE: dict[str, tuple[float, str | None]] = {}
+_CACHE_TTL = 30.0
+
+# Derived entry: the LIKE pattern for the target city, kept alongside the
+# raw value and dropped whenever ``target_city`` is written.
+_PATTERN_KEY = "_target_city_pattern"
+
 
 class Settings(db.Model):
     """Application settings stored in the database."""
@@ -13,20 +28,65 @@ class Settings(db.Model):
 
     @classmethod
     def get(cls, key: str, default: str = None) -> str:
-        """Get a setting value by key."""
-        setting = cls.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        """Get a setting value by key (cached for a few seconds)."""
+        cached = _CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            value = cached[1]
+        else:
+            value = db.session.execute(
+                db.select(cls.value).where(cls.key == key)
+            ).scalar()
+            _CACHE[key] = (time.monotonic() + _CACHE_TTL, value)
+        return value if value is not None else default
+
+    @classmethod
+    def get_many(cls, keys: list[str]) -> dict[str, str]:
+        """Get several settings with a single query.
+
+        Returns a dict of key -> value; keys with no stored value are omitted
+        so callers can use ``result.get(key, default)``.
+        """
+        now = time.monotonic()
+        values = {}
+        missing = []
+        for key in keys:
+            cached = _CACHE.get(key)
+            if cached and cached[0] > now:
+                values[key] = cached[1]
+            else:
+                missing.append(key)
+
+        if missing:
+            rows = db.session.execute(
+                db.select(cls.key, cls.value).where(cls.key.in_(missing))
+            ).all()
+            found = dict(rows)
+            for key in missing:
+                values[key] = found.get(key)
+                _CACHE[key] = (now + _CACHE_TTL, values[key])
+
+        return {k: v for k, v in values.items() if v is not None}
 
     @classmethod
     def set(cls, key: str, value: str) -> None:
         """Set a setting value."""
-        setting = cls.query.filter_by(key=key).first()
-        if setting:
-            setting.value = value
-        else:
-            setting = cls(key=key, value=value)
-            db.session.add(setting)
+        cls.set_many({key: value})
+
+    @classmethod
+    def set_many(cls, items: dict[str, str]) -> None:
+        """Set several settings with a single upsert and commit."""
+        if not items:
+            return
+        stmt = insert(cls.__table__).values(
+            [{"key": key, "value": value} for key, value in items.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value, "updated_at": db.func.now()},
+        )
+        db.session.execute(stmt)
         db.session.commit()
+        _invalidate(*items)
 
     @classmethod
     def get_target_city(cls) -> str:
@@ -42,12 +102,12 @@ class Settings(db.Model):
     @classmethod
     def get_target_city_pattern(cls) -> str:
         """Get the SQL LIKE pattern for matching the target city."""
-        city = cls.get_target_city()
-        if city:
-            # Remove " CITY" suffix for pattern matching if present
-            base = city.replace(" CITY", "").replace(" city", "")
-            return f"{base}%"
-        return "COLUMBUS%"
+        cached = _CACHE.get(_PATTERN_KEY)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        pattern = _city_pattern(cls.get_target_city())
+        _CACHE[_PATTERN_KEY] = (time.monotonic() + _CACHE_TTL, pattern)
+        return pattern
 
     @classmethod
     def get_signature_goal(cls) -> int:
@@ -70,33 +130,43 @@ class Settings(db.Model):
     @classmethod
     def get_backup_config(cls) -> dict:
         """Return all backup-related settings as a dict."""
+        values = cls.get_many([
+            "backup_scp_host",
+            "backup_scp_port",
+            "backup_scp_user",
+            "backup_scp_key_content",
+            "backup_scp_remote_path",
+            "backup_schedule",
+            "backup_compression",
+            "backup_last_run",
+            "backup_last_status",
+        ])
         return {
-            "scp_host": cls.get("backup_scp_host", ""),
-            "scp_port": cls.get("backup_scp_port", "22"),
-            "scp_user": cls.get("backup_scp_user", ""),
-            "has_key": bool(cls.get("backup_scp_key_content")),
+            "scp_host": values.get("backup_scp_host", ""),
+            "scp_port": values.get("backup_scp_port", "22"),
+            "scp_user": values.get("backup_scp_user", ""),
+            "has_key": bool(values.get("backup_scp_key_content")),
             "key_fingerprint": cls._compute_key_fingerprint(),
-            "scp_remote_path": cls.get("backup_scp_remote_path", ""),
-            "schedule": cls.get("backup_schedule", ""),
-            "last_run": cls.get("backup_last_run", ""),
-            "last_status": cls.get("backup_last_status", ""),
+            "scp_remote_path": values.get("backup_scp_remote_path", ""),
+            "schedule": values.get("backup_schedule", ""),
+            "compression": values.get("backup_compression", "fast"),
+            "last_run": values.get("backup_last_run", ""),
+            "last_status": values.get("backup_last_status", ""),
         }
 
     @classmethod
     def _compute_key_fingerprint(cls) -> str:
-        """Return the SHA-256 fingerprint of the stored key (OpenSSH format)."""
-        key_content = cls.get("backup_scp_key_content")
-        if not key_content:
+        """Return the stored SHA-256 fingerprint of the backup key.
+
+        The fingerprint is computed when the key is saved (see
+        ``app.services.backup.key_fingerprint``) so rendering the settings
+        page never has to parse the key. Keys saved before fingerprints were
+        stored are fingerprinted by migration f3b9d1a7c5e2.
+        """
+        values = cls.get_many(["backup_scp_key_content", "backup_scp_key_fingerprint"])
+        if not values.get("backup_scp_key_content"):
             return ""
-        try:
-            import base64
-            import hashlib
-            from app.services.backup import _load_pkey
-            pkey = _load_pkey(key_content)
-            digest = hashlib.sha256(pkey.asbytes()).digest()
-            return "SHA256:" + base64.b64encode(digest).decode().rstrip("=")
-        except Exception:
-            return "(error computing fingerprint)"
+        return values.get("backup_scp_key_fingerprint") or "unknown"
 
     @classmethod
     def save_backup_config(
@@ -106,18 +176,24 @@ class Settings(db.Model):
         user: str,
         remote_path: str,
         key_content: str | None = None,
+        key_fingerprint: str | None = None,
     ) -> None:
         """Persist SCP backup configuration.
 
-        If *key_content* is provided it replaces any previously stored key.
-        Omit (or pass None) to keep the existing stored key unchanged.
+        If *key_content* is provided it replaces any previously stored key,
+        along with its *key_fingerprint*. Omit (or pass None) to keep the
+        existing stored key unchanged.
         """
-        cls.set("backup_scp_host", host.strip())
-        cls.set("backup_scp_port", port.strip() or "22")
-        cls.set("backup_scp_user", user.strip())
-        cls.set("backup_scp_remote_path", remote_path.strip())
+        items = {
+            "backup_scp_host": host.strip(),
+            "backup_scp_port": port.strip() or "22",
+            "backup_scp_user": user.strip(),
+            "backup_scp_remote_path": remote_path.strip(),
+        }
         if key_content is not None:
-            cls.set("backup_scp_key_content", key_content)
+            items["backup_scp_key_content"] = key_content
+            items["backup_scp_key_fingerprint"] = key_fingerprint or ""
+        cls.set_many(items)
 
     # ------------------------------------------------------------------
     # SMTP / email settings
@@ -126,25 +202,59 @@ class Settings(db.Model):
     @classmethod
     def get_smtp_config(cls) -> dict:
         """Return all SMTP-related settings as a dict."""
+        values = cls.get_many([
+            "smtp_host",
+            "smtp_port",
+            "smtp_user",
+            "smtp_from_email",
+            "smtp_use_tls",
+            "smtp_password",
+        ])
         return {
-            "host": cls.get("smtp_host", ""),
-            "port": cls.get("smtp_port", "587"),
-            "user": cls.get("smtp_user", ""),
-            "from_email": cls.get("smtp_from_email", ""),
-            "use_tls": cls.get("smtp_use_tls", "true"),
-            "has_password": bool(cls.get("smtp_password")),
+            "host": values.get("smtp_host", ""),
+            "port": values.get("smtp_port", "587"),
+            "user": values.get("smtp_user", ""),
+            "from_email": values.get("smtp_from_email", ""),
+            "use_tls": values.get("smtp_use_tls", "true"),
+            "has_password": bool(values.get("smtp_password")),
         }
 
     @classmethod
     def save_smtp_config(cls, host, port, user, from_email, use_tls, password=None):
         """Persist SMTP configuration. Password is only overwritten if provided."""
-        cls.set("smtp_host", host.strip())
-        cls.set("smtp_port", port.strip() or "587")
-        cls.set("smtp_user", user.strip())
-        cls.set("smtp_from_email", from_email.strip())
-        cls.set("smtp_use_tls", "true" if use_tls else "false")
+        items = {
+            "smtp_host": host.strip(),
+            "smtp_port": port.strip() or "587",
+            "smtp_user": user.strip(),
+            "smtp_from_email": from_email.strip(),
+            "smtp_use_tls": "true" if use_tls else "false",
+        }
         if password:
-            cls.set("smtp_password", password)
+            items["smtp_password"] = password
+        cls.set_many(items)
 
     def __repr__(self):
         return f"<Settings {self.key}={self.value}>"
+
+
+def _city_pattern(city: str) -> str:
+    if city:
+        # Remove " CITY" suffix for pattern matching if present
+        base = city.replace(" CITY", "").replace(" city", "")
+        return f"{base}%"
+    return "COLUMBUS%"
+
+
+@event.listens_for(Settings, "after_insert")
+@event.listens_for(Settings, "after_update")
+@event.listens_for(Settings, "after_delete")
+def _invalidate_cached_setting(mapper, connection, target):
+    """Drop cached values written through the ORM outside of ``set``."""
+    _invalidate(target.key)
+
+
+def _invalidate(*keys: str) -> None:
+    for key in keys:
+        _CACHE.pop(key, None)
+    if "target_city" in keys:
+        _CACHE.pop(_PATTERN_KEY, None)
@@ -1,3 +1,6 @@
+from flask import g
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from app import db
 
 
@@ -14,7 +17,7 @@ class Signature(db.Model):
 
     # Book and batch tracking
     book_id = db.Column(db.Integer, db.ForeignKey("books.id"))
-    batch_id = db.Column(db.Integer, db.ForeignKey("batches.id"))
+    batch_id = db.Column(db.Integer, db.ForeignKey("batches.id"), index=True)
 
     # Address info (copied from voter record at time of entry)
     residential_address1 = db.Column(db.String(255))
@@ -35,14 +38,51 @@ class Signature(db.Model):
     book = db.relationship("Book", back_populates="signatures")
     batch = db.relationship("Batch", back_populates="signatures")
 
-    @property
+    __table_args__ = (
+        # Per-book stats; also serves lookups on book_id alone
+        db.Index("ix_signatures_book_matched", "book_id", "matched"),
+        # Matched-signature export: its WHERE clause, per-book id order, and
+        # the count/max(id) freshness check as an index-only scan
+        db.Index(
+            "ix_signatures_matched_book_id",
+            "book_id",
+            "id",
+            postgresql_where=db.text("matched = TRUE"),
+        ),
+        # Trigram index for target-city matching (registered_city LIKE 'X%')
+        db.Index(
+            "idx_signatures_registered_city_trgm",
+            registered_city,
+            postgresql_using="gin",
+            postgresql_ops={"registered_city": "gin_trgm_ops"},
+        ),
+    )
+
+    @hybrid_property
     def is_target_city_resident(self):
-        """Check if registered city matches the target city."""
+        """Check if registered city matches the target city.
+
+        The target-city prefix is looked up once per request and kept on
+        ``flask.g`` so rendering a list of signatures doesn't re-read it
+        for every row.
+        """
+        if not self.registered_city:
+            return False
+        if "target_city_pattern" not in g:
+            from app.models import Settings
+            g.target_city_pattern = Settings.get_target_city_pattern().rstrip('%')
+        return self.registered_city.upper().startswith(g.target_city_pattern)
+
+    @is_target_city_resident.inplace.expression
+    @classmethod
+    def _is_target_city_resident_expression(cls):
+        """SQL form, e.g. ``select(func.count()).where(Signature.is_target_city_resident)``.
+
+        A plain ``LIKE 'PREFIX%'`` (registered_city is stored upper-case, as
+        in StatsService) so Postgres can use the trigram index.
+        """
         from app.models import Settings
-        if self.registered_city:
-            pattern = Settings.get_target_city_pattern().rstrip('%')
-            return self.registered_city.upper().startswith(pattern)
-        return False
+        return cls.registered_city.like(Settings.get_target_city_pattern())
 
     @property
     def has_address(self):
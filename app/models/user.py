@@ -1,11 +1,17 @@
-from functools import wraps
+import secrets
+from functools import lru_cache, wraps
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask import abort, flash, redirect, url_for
 from flask_login import UserMixin, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 
 from app import db, login_manager
 
+# Argon2 runs in native code and releases the GIL while hashing.
+_password_hasher = PasswordHasher()
+
 
 class UserRole:
     """User role constants."""
@@ -38,10 +44,28 @@ class User(UserMixin, db.Model):
     organization = db.relationship("Organization", back_populates="users")
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """Verify *password*, upgrading legacy or outdated hashes in place.
+
+        Hashes created by Werkzeug (``pbkdf2:``/``scrypt:``) are replaced with
+        Argon2 on a successful check; the caller commits the session.
+        """
+        if not self.password_hash:
+            return False
+        if not self.password_hash.startswith("$argon2"):
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+        try:
+            _password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if _password_hasher.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
 
     @property
     def full_name(self):
@@ -70,6 +94,25 @@ class User(UserMixin, db.Model):
         return f"<User {self.email}>"
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash():
+    return _password_hasher.hash(secrets.token_urlsafe(16))
+
+
+def dummy_check_password(password):
+    """Burn the time of a real Argon2 check for a login with an unknown email.
+
+    Without it, a failed login for an unknown address returns measurably
+    faster than one for a registered address, which leaks which emails have
+    accounts.
+    """
+    try:
+        _password_hasher.verify(_dummy_password_hash(), password)
+    except VerificationError:
+        pass
+    return False
+
+
 def admin_required(f):
     """Decorator to require admin role for a route."""
     @wraps(f)
@@ -98,4 +141,6 @@ def organizer_required(f):
 
 @login_manager.user_loader
 def load_user(id):
+    # Not cached: is_active, role and must_change_password must reflect the
+    # latest commit on every worker, so each request reads the row.
     return db.session.get(User, int(id))
@@ -47,6 +47,25 @@ class Voter(db.Model):
             postgresql_using="gin",
             postgresql_ops={"last_name": "gin_trgm_ops"},
         ),
+        db.Index(
+            "idx_voters_first_name_trgm",
+            first_name,
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        # Trigram index for city search
+        db.Index(
+            "idx_voters_city_trgm",
+            residential_city,
+            postgresql_using="gin",
+            postgresql_ops={"residential_city": "gin_trgm_ops"},
+        ),
+        # Covers the settings page's per-city voter counts
+        db.Index(
+            "idx_voters_city",
+            city,
+            postgresql_where=db.text("city IS NOT NULL AND city <> ''"),
+        ),
     )
 
     @property
@@ -1,9 +1,10 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, login_required, current_user
-from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
+from itsdangerous import SignatureExpired, BadSignature
 
 from app import db
 from app.models import User
+from app.models.user import dummy_check_password
 from app.services import email as email_service
 
 bp = Blueprint("auth", __name__)
@@ -16,11 +17,16 @@ def login():
 
     if request.method == "POST":
         email = request.form.get("email")
-        password = request.form.get("password")
+        password = request.form.get("password", "")
 
         user = User.query.filter_by(email=email).first()
 
-        if user and user.check_password(password):
+        if user is None:
+            # Take as long as a real check so timing doesn't reveal accounts
+            dummy_check_password(password)
+        elif user.check_password(password):
+            if user in db.session.dirty:
+                db.session.commit()  # persist an upgraded password hash
             login_user(user)
             if user.must_change_password:
                 return redirect(url_for("auth.change_password"))
@@ -50,7 +56,7 @@ def register():
         first_name = request.form.get("first_name")
         last_name = request.form.get("last_name")
 
-        if User.query.filter_by(email=email).first():
+        if db.session.execute(db.select(db.exists().where(User.email == email))).scalar():
             flash("Email already registered", "error")
             return render_template("auth/register.html")
 
@@ -105,13 +111,12 @@ def forgot_password():
         )
         user = User.query.filter_by(email=email).first()
         if user and smtp_configured:
-            try:
-                s = URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt="password-reset")
-                token = s.dumps(user.id)
-                reset_url = url_for("auth.reset_password", token=token, _external=True)
-                email_service.send_password_reset_email(user.email, reset_url)
-            except Exception:
-                current_app.logger.exception("Failed to send password reset email to %s", email)
+            s = current_app.extensions["password_reset_serializer"]
+            token = s.dumps(user.id)
+            reset_url = url_for("auth.reset_password", token=token, _external=True)
+            email_service.send_password_reset_email_async(
+                current_app._get_current_object(), user.email, reset_url
+            )
         return redirect(url_for("auth.forgot_password"))
 
     return render_template("auth/forgot_password.html", smtp_configured=smtp_configured)
@@ -121,7 +126,7 @@ def forgot_password():
 def reset_password(token):
     from flask import current_app
 
-    s = URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt="password-reset")
+    s = current_app.extensions["password_reset_serializer"]
     try:
         user_id = s.loads(token, max_age=3600)
     except SignatureExpired:
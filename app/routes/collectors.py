@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.models import Collector, DataEnterer, Organization
@@ -12,7 +13,11 @@ bp = Blueprint("collectors", __name__)
 @login_required
 def index():
     """List all collectors."""
-    collectors = Collector.query.order_by(Collector.last_name, Collector.first_name).all()
+    collectors = (
+        Collector.query.options(joinedload(Collector.organization))
+        .order_by(Collector.last_name, Collector.first_name)
+        .all()
+    )
     return render_template("collectors/index.html", collectors=collectors)
 
 
@@ -20,7 +25,7 @@ def index():
 @login_required
 def new():
     """Create a new collector."""
-    organizations = Organization.query.order_by(Organization.name).all()
+    organizations = Organization.choices()
 
     if request.method == "POST":
         email = request.form.get("email", "").strip()
@@ -55,7 +60,7 @@ def new():
 def edit(id):
     """Edit a collector."""
     collector = db.session.get(Collector, id)
-    organizations = Organization.query.order_by(Organization.name).all()
+    organizations = Organization.choices()
 
     if not collector:
         flash("Collector not found", "error")
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
 from flask_login import login_required
+from sqlalchemy.orm import load_only
 
 from app import db
 from app.models import admin_required
@@ -83,7 +84,18 @@ def upload():
 @admin_required
 def status(import_id):
     """Get import status as JSON for polling."""
-    voter_import = db.session.get(VoterImport, import_id)
+    # Polled every second per active import; load only what the dict needs
+    voter_import = db.session.get(
+        VoterImport,
+        import_id,
+        options=[load_only(
+            VoterImport.status,
+            VoterImport.processed_rows,
+            VoterImport.total_rows,
+            VoterImport.error_message,
+            VoterImport.completed_at,
+        )],
+    )
     if not voter_import:
         return jsonify({"error": "Import not found"}), 404
 
@@ -104,11 +116,11 @@ def cancel(import_id):
         flash("Import is not running", "error")
         return redirect(url_for("imports.index"))
 
-    # Try to signal the running thread
+    # Try to signal the running thread (in this or another worker process)
     thread_signalled = VoterImportService.cancel_import(import_id)
 
     if thread_signalled:
-        # Thread is alive — set DB flag and let the thread handle it
+        # Import is alive — set DB flag and let its thread handle it
         voter_import.cancel_requested = True
         db.session.commit()
         flash("Cancellation requested", "info")
@@ -13,7 +13,7 @@ bp = Blueprint("main", __name__)
 @login_required
 def index():
     """Home page - session setup for data entry."""
-    collectors = Collector.query.order_by(Collector.last_name, Collector.first_name).all()
+    collectors = Collector.choices()
 
     # Get current session info if set
     book_id = session.get("book_id")
@@ -53,12 +53,11 @@ def start_session():
             date_back=date_back,
         )
         db.session.add(book)
-        db.session.commit()
+        db.session.flush()  # assigns book.id for the batch below
     else:
         # Update dates on existing book
         book.date_out = date_out
         book.date_back = date_back
-        db.session.commit()
 
     # Create a new batch for this session
     batch = Batch(
@@ -72,12 +71,14 @@ def start_session():
         date_entered=date.today(),
     )
     db.session.add(batch)
-    db.session.commit()
+    db.session.flush()
 
-    # Store session info
+    # Store session info. Read the ids before committing: commit expires
+    # the objects and reading them afterwards would reload each row.
     session["book_id"] = book.id
     session["batch_id"] = batch.id
     session["book_number"] = book_number
+    db.session.commit()
 
     flash(f"Started session for Book {book_number}", "success")
     return redirect(url_for("signatures.entry"))
@@ -91,12 +92,18 @@ def check_book():
     if not book_number:
         return {"exists": False}
 
-    book = Book.query.filter_by(book_number=book_number).first()
-    if book:
+    # One row of plain values; no Book or Collector objects are loaded
+    row = db.session.execute(
+        db.select(Book.book_number, Collector.display_name)
+        .outerjoin(Book.collector)
+        .where(Book.book_number == book_number)
+        .limit(1)
+    ).first()
+    if row:
         return {
             "exists": True,
-            "book_number": book.book_number,
-            "collector": book.collector.display_name if book.collector else "Unknown",
+            "book_number": row.book_number,
+            "collector": row.display_name or "Unknown",
         }
     return {"exists": False}
 
@@ -1,8 +1,10 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
 from app import db
-from app.models import Organization, organizer_required
+from app.models import Collector, Organization, User, organizer_required
 
 bp = Blueprint("organizations", __name__)
 
@@ -12,7 +14,13 @@ bp = Blueprint("organizations", __name__)
 @organizer_required
 def index():
     """List all organizations."""
-    organizations = Organization.query.order_by(Organization.name).all()
+    organizations = (
+        Organization.query.options(
+            selectinload(Organization.collectors), selectinload(Organization.users)
+        )
+        .order_by(Organization.name)
+        .all()
+    )
     return render_template("organizations/index.html", organizations=organizations)
 
 
@@ -28,13 +36,15 @@ def new():
             flash("Organization name is required", "error")
             return render_template("organizations/new.html")
 
-        if Organization.query.filter_by(name=name).first():
-            flash("Organization already exists", "error")
-            return render_template("organizations/new.html")
-
         org = Organization(name=name)
         db.session.add(org)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # ix_organizations_name
+            db.session.rollback()
+            flash("Organization already exists", "error")
+            return render_template("organizations/new.html")
 
         flash(f"Organization '{org.name}' created successfully", "success")
         return redirect(url_for("organizations.index"))
@@ -60,15 +70,15 @@ def edit(id):
             flash("Organization name is required", "error")
             return render_template("organizations/edit.html", organization=org)
 
-        # Check if name already exists for a different org
-        existing = Organization.query.filter_by(name=name).first()
-        if existing and existing.id != org.id:
+        org.name = name
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another organization has this name (ix_organizations_name)
+            db.session.rollback()
             flash("Organization name already exists", "error")
             return render_template("organizations/edit.html", organization=org)
 
-        org.name = name
-        db.session.commit()
-
         flash(f"Organization '{org.name}' updated successfully", "success")
         return redirect(url_for("organizations.index"))
 
@@ -86,13 +96,20 @@ def delete(id):
         flash("Organization not found", "error")
         return redirect(url_for("organizations.index"))
 
-    # Check if organization has collectors or users
-    if org.collectors:
-        flash(f"Cannot delete organization with {len(org.collectors)} collector(s) assigned", "error")
+    # Check if organization has collectors or users (counted in SQL, so the
+    # collections themselves are never loaded)
+    collector_count = db.session.scalar(
+        db.select(db.func.count(Collector.id)).where(Collector.organization_id == org.id)
+    )
+    if collector_count:
+        flash(f"Cannot delete organization with {collector_count} collector(s) assigned", "error")
         return redirect(url_for("organizations.index"))
 
-    if org.users:
-        flash(f"Cannot delete organization with {len(org.users)} user(s) assigned", "error")
+    user_count = db.session.scalar(
+        db.select(db.func.count(User.id)).where(User.organization_id == org.id)
+    )
+    if user_count:
+        flash(f"Cannot delete organization with {user_count} user(s) assigned", "error")
         return redirect(url_for("organizations.index"))
 
     name = org.name
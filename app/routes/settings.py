@@ -1,12 +1,10 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify, make_response
 from flask_login import login_required
-from sqlalchemy import text
 
-from app import db
 from app.models import Settings, admin_required
 from app.services import backup as backup_service
-from app.services import scheduler as scheduler_service
 from app.services import email as email_service
+from app.services.voter_import import VoterImportService
 from app.utils import is_valid_email
 
 bp = Blueprint("settings", __name__)
@@ -37,13 +35,13 @@ def index():
 
     current_city = Settings.get_target_city()
     signature_goal = Settings.get_signature_goal()
-    cities = get_distinct_cities()
+    cities = VoterImportService.get_distinct_cities()
     backup_config = Settings.get_backup_config()
     backup_configured = backup_service.is_configured()
     smtp_config = Settings.get_smtp_config()
     smtp_configured = email_service.is_configured()
 
-    return render_template(
+    response = make_response(render_template(
         "settings/index.html",
         current_city=current_city,
         cities=cities,
@@ -52,7 +50,13 @@ def index():
         backup_configured=backup_configured,
         smtp_config=smtp_config,
         smtp_configured=smtp_configured,
-    )
+    ))
+    # The page's queries are served from the settings and city caches, so
+    # the remaining cost is the body itself: tag it with a hash of its
+    # content and answer revalidations of an unchanged page with a 304.
+    response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
 
 
 @bp.route("/save-backup-config", methods=["POST"])
@@ -77,12 +81,19 @@ def save_backup_config():
         user=request.form.get("scp_user", ""),
         remote_path=request.form.get("scp_remote_path", ""),
         key_content=key_content,
+        key_fingerprint=backup_service.key_fingerprint(key_content) if key_content else None,
     )
 
     schedule = request.form.get("backup_schedule", "")
     if schedule not in ("", "hourly", "daily", "weekly"):
         schedule = ""
-    Settings.set("backup_schedule", schedule)
+    compression = request.form.get("backup_compression", "fast")
+    if compression not in backup_service.COMPRESSION_CHOICES:
+        compression = "fast"
+    Settings.set_many({"backup_schedule": schedule, "backup_compression": compression})
+
+    # Imported here so loading the blueprint doesn't pull in APScheduler
+    from app.services import scheduler as scheduler_service
     scheduler_service.apply_schedule(current_app._get_current_object())
 
     flash("Backup configuration saved", "success")
@@ -98,11 +109,17 @@ def test_backup_connection():
         if not backup_service.is_configured():
             return jsonify(ok=False, message="Backup is not fully configured.")
 
+        values = Settings.get_many([
+            "backup_scp_host",
+            "backup_scp_port",
+            "backup_scp_user",
+            "backup_scp_key_content",
+        ])
         scp_config = {
-            "host": Settings.get("backup_scp_host"),
-            "port": int(Settings.get("backup_scp_port", "22") or "22"),
-            "user": Settings.get("backup_scp_user"),
-            "key_content": Settings.get("backup_scp_key_content"),
+            "host": values.get("backup_scp_host"),
+            "port": int(values.get("backup_scp_port", "22") or "22"),
+            "user": values.get("backup_scp_user"),
+            "key_content": values.get("backup_scp_key_content"),
         }
         password = request.form.get("test_password") or None
         ok, message = backup_service.test_sftp_connection(scp_config, password=password)
@@ -168,23 +185,3 @@ def test_smtp():
         current_app.logger.exception("SMTP test failed")
         return jsonify(ok=False, message=f"Error: {exc}"), 500
 
-
-def get_distinct_cities() -> list[dict]:
-    """Get distinct cities from the voter file."""
-    result = db.session.execute(text("""
-        SELECT DISTINCT city, COUNT(*) as count
-        FROM voters
-        WHERE city IS NOT NULL AND city != ''
-        GROUP BY city
-        ORDER BY count DESC
-    """))
-
-    cities = []
-    for row in result:
-        cities.append({
-            "value": row.city,
-            "label": row.city.title(),
-            "count": row.count,
-        })
-
-    return cities
@@ -1,7 +1,8 @@
 from datetime import date
 
-from flask import Blueprint, render_template, request, session, flash, redirect, url_for
+from flask import Blueprint, render_template, request, session, flash, redirect, url_for, current_app
 from flask_login import login_required
+from sqlalchemy import text
 
 from app import db
 from app.models import Signature, Voter
@@ -9,6 +10,78 @@ from app.services import VoterSearchService
 
 bp = Blueprint("signatures", __name__)
 
+# match_type accepted by record_batch -> Signature.matched (None = no voter)
+MATCH_TYPES = {"person": True, "address": False, "none": None}
+
+# The voter columns a signature copies; selected instead of whole Voter rows
+VOTER_COLUMNS = (
+    Voter.id,
+    Voter.sos_voterid,
+    Voter.county_number,
+    Voter.residential_address1,
+    Voter.residential_address2,
+    Voter.residential_city,
+    Voter.residential_state,
+    Voter.residential_zip,
+    Voter.city,
+)
+
+
+def _signature_row(book_id, batch_id, voter=None, matched=False):
+    """Column values for a new signature, with address fields copied from *voter*.
+
+    *voter* is a row of ``VOTER_COLUMNS`` (a Voter works too).
+    """
+    row = {"book_id": book_id, "batch_id": batch_id, "matched": matched}
+    if voter is not None:
+        row.update(
+            sos_voterid=voter.sos_voterid,
+            county_number=voter.county_number,
+            residential_address1=voter.residential_address1,
+            residential_address2=voter.residential_address2,
+            residential_city=voter.residential_city,
+            residential_state=voter.residential_state,
+            residential_zip=voter.residential_zip,
+            registered_city=voter.city,
+        )
+    return row
+
+
+# Confirmation shown after recording each kind of signature
+SUCCESS_MESSAGES = {
+    "person": "Person Match recorded",
+    "address": "Address Only recorded",
+    "none": "No Match recorded",
+}
+
+# Rendered _success.html per match_type; the fragment has no per-request data
+_success_html = {}
+
+
+def _render_success(match_type):
+    """Return the confirmation fragment for *match_type*, rendered once per process."""
+    html = _success_html.get(match_type)
+    if html is None or current_app.debug:
+        html = render_template(
+            "signatures/_success.html",
+            message=SUCCESS_MESSAGES[match_type],
+            match_type=match_type,
+        )
+        _success_html[match_type] = html
+    return html
+
+
+def _insert_signatures(rows):
+    """Insert signature rows in one statement and commit.
+
+    Rows go through a bulk INSERT rather than Signature objects, so no ORM
+    state is built for them. See ``SIGNATURE_ASYNC_COMMIT`` in config.
+    """
+    if current_app.config["SIGNATURE_ASYNC_COMMIT"]:
+        db.session.execute(text("SET LOCAL synchronous_commit TO OFF"))
+    db.session.execute(db.insert(Signature), rows)
+    db.session.commit()
+
 
 @bp.route("/")
 @login_required
@@ -56,34 +129,17 @@ def record_match():
         return {"error": "No active session"}, 400
 
     voter_id = request.form.get("voter_id")
-    voter = db.session.get(Voter, voter_id) if voter_id else None
+    voter = (
+        db.session.execute(db.select(*VOTER_COLUMNS).where(Voter.id == voter_id)).first()
+        if voter_id else None
+    )
 
     if not voter:
         return {"error": "Voter not found"}, 404
 
-    signature = Signature(
-        book_id=book_id,
-        batch_id=batch_id,
-        sos_voterid=voter.sos_voterid,
-        county_number=voter.county_number,
-        residential_address1=voter.residential_address1,
-        residential_address2=voter.residential_address2,
-        residential_city=voter.residential_city,
-        residential_state=voter.residential_state,
-        residential_zip=voter.residential_zip,
-        registered_city=voter.city,
-        matched=True,
-    )
+    _insert_signatures([_signature_row(book_id, batch_id, voter, matched=True)])
 
-    db.session.add(signature)
-    db.session.commit()
-
-    return render_template(
-        "signatures/_success.html",
-        message="Person Match recorded",
-        voter=voter,
-        match_type="person"
-    )
+    return _render_success("person")
 
 
 @bp.route("/record-address-only", methods=["POST"])
@@ -97,34 +153,18 @@ def record_address_only():
         return {"error": "No active session"}, 400
 
     voter_id = request.form.get("voter_id")
-    voter = db.session.get(Voter, voter_id) if voter_id else None
+    voter = (
+        db.session.execute(db.select(*VOTER_COLUMNS).where(Voter.id == voter_id)).first()
+        if voter_id else None
+    )
 
     if not voter:
         return {"error": "Voter not found"}, 404
 
-    signature = Signature(
-        book_id=book_id,
-        batch_id=batch_id,
-        sos_voterid=voter.sos_voterid,
-        county_number=voter.county_number,
-        residential_address1=voter.residential_address1,
-        residential_address2=voter.residential_address2,
-        residential_city=voter.residential_city,
-        residential_state=voter.residential_state,
-        residential_zip=voter.residential_zip,
-        registered_city=voter.city,
-        matched=False,  # Address only = not a person match
-    )
+    # Address only = not a person match
+    _insert_signatures([_signature_row(book_id, batch_id, voter, matched=False)])
 
-    db.session.add(signature)
-    db.session.commit()
-
-    return render_template(
-        "signatures/_success.html",
-        message="Address Only recorded",
-        voter=voter,
-        match_type="address"
-    )
+    return _render_success("address")
 
 
 @bp.route("/record-no-match", methods=["POST"])
@@ -138,18 +178,64 @@ def record_no_match():
         return {"error": "No active session"}, 400
 
     # Create signature with minimal info (no voter data)
-    signature = Signature(
-        book_id=book_id,
-        batch_id=batch_id,
-        matched=False,
-    )
+    _insert_signatures([_signature_row(book_id, batch_id)])
 
-    db.session.add(signature)
-    db.session.commit()
+    return _render_success("none")
 
-    return render_template(
-        "signatures/_success.html",
-        message="No Match recorded",
-        voter=None,
-        match_type="none"
-    )
+
+@bp.route("/record-batch", methods=["POST"])
+@login_required
+def record_batch():
+    """Record several signatures in one request and one commit.
+
+    Expects a JSON list of ``{"match_type": "person" | "address" | "none",
+    "voter_id": ...}`` objects; ``voter_id`` is ignored for "none".
+    """
+    book_id = session.get("book_id")
+    batch_id = session.get("batch_id")
+
+    if not book_id or not batch_id:
+        return {"error": "No active session"}, 400
+
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        return {"error": "Expected a JSON list of signatures"}, 400
+
+    entries = []
+    for item in items:
+        match_type = item.get("match_type") if isinstance(item, dict) else None
+        if match_type not in MATCH_TYPES:
+            return {"error": "match_type must be person, address or none"}, 400
+        voter_id = None
+        if match_type != "none":
+            try:
+                voter_id = int(item.get("voter_id"))
+            except (TypeError, ValueError):
+                return {"error": "voter_id is required for person and address matches"}, 400
+        entries.append((match_type, voter_id))
+
+    voter_ids = {voter_id for _, voter_id in entries if voter_id is not None}
+    voters = {}
+    if voter_ids:
+        voters = {
+            voter.id: voter
+            for voter in db.session.execute(
+                db.select(*VOTER_COLUMNS).where(Voter.id.in_(voter_ids))
+            )
+        }
+    missing = voter_ids - voters.keys()
+    if missing:
+        return {"error": f"Voter not found: {', '.join(map(str, sorted(missing)))}"}, 404
+
+    rows = []
+    for match_type, voter_id in entries:
+        if voter_id is None:
+            rows.append(_signature_row(book_id, batch_id))
+        else:
+            rows.append(
+                _signature_row(book_id, batch_id, voters[voter_id], matched=MATCH_TYPES[match_type])
+            )
+
+    _insert_signatures(rows)
+
+    return {"recorded": len(rows)}
@@ -1,8 +1,10 @@
-import csv
-import io
+import glob
+import os
+import tempfile
+import time
 from datetime import date
 
-from flask import Blueprint, render_template, request, Response
+from flask import Blueprint, render_template, request, current_app, send_file
 from flask_login import login_required
 from sqlalchemy import text
 
@@ -12,6 +14,57 @@ from app.services import StatsService
 
 bp = Blueprint("stats", __name__)
 
+# Seconds a built matched export is served before being rebuilt even though
+# no signature was matched since (collector and voter names can change)
+EXPORT_MAX_AGE = 300
+
+# Matched count and last id; signatures are append-only, so together they
+# identify the export's contents
+_MATCHED_EXPORT_VERSION_SQL = text(
+    "SELECT count(*), coalesce(max(id), 0) FROM signatures WHERE matched = TRUE"
+)
+
+# Postgres writes the export itself; the column aliases are the CSV header.
+# Blank values are turned into NULLs, which CSV COPY writes as empty fields
+# (an empty string would be written as ""). NULLIF(..., '') inside CONCAT_WS
+# also makes it skip blank parts, not just NULL ones.
+_MATCHED_EXPORT_COPY = """
+    COPY (
+        SELECT
+            NULLIF(s.sos_voterid, '')          AS sos_voterid,
+            NULLIF(v.first_name, '')           AS first_name,
+            NULLIF(v.last_name, '')            AS last_name,
+            NULLIF(CONCAT_WS(', ',
+                NULLIF(CONCAT_WS(' ',
+                    NULLIF(s.residential_address1, ''),
+                    NULLIF(s.residential_address2, '')
+                ), ''),
+                NULLIF(CONCAT_WS(', ',
+                    NULLIF(s.residential_city, ''),
+                    NULLIF(CONCAT_WS(' ',
+                        NULLIF(s.residential_state, ''),
+                        NULLIF(s.residential_zip, '')
+                    ), '')
+                ), '')
+            ), '')                             AS full_address,
+            NULLIF(s.residential_address1, '') AS address1,
+            NULLIF(s.residential_address2, '') AS address2,
+            NULLIF(s.residential_city, '')     AS city,
+            NULLIF(s.residential_state, '')    AS state,
+            NULLIF(s.residential_zip, '')      AS zip,
+            NULLIF(s.registered_city, '')      AS registered_city,
+            NULLIF(b.book_number, '')          AS book_number,
+            NULLIF(CONCAT_WS(' ', NULLIF(c.first_name, ''), NULLIF(c.last_name, '')), '')
+                                               AS collector,
+            TO_CHAR(s.created_at, 'YYYY-MM-DD HH24:MI') AS date_entered
+        FROM signatures s
+        LEFT JOIN voters     v ON v.sos_voterid = s.sos_voterid
+        LEFT JOIN books      b ON b.id = s.book_id
+        LEFT JOIN collectors c ON c.id = b.collector_id
+        WHERE s.matched = TRUE
+        ORDER BY b.book_number, s.id
+    ) TO STDOUT WITH (FORMAT CSV, HEADER)
+"""
 
 @bp.route("/")
 @login_required
@@ -41,79 +94,83 @@ def organizations():
 @bp.route("/export-matched.csv")
 @login_required
 def export_matched_csv():
-    """Download matched signatures as a CSV including sos_voterid and voter names."""
-    rows = db.session.execute(text("""
-        SELECT
-            s.sos_voterid,
-            v.first_name,
-            v.last_name,
-            s.residential_address1,
-            s.residential_address2,
-            s.residential_city,
-            s.residential_state,
-            s.residential_zip,
-            s.registered_city,
-            b.book_number,
-            c.first_name  AS collector_first,
-            c.last_name   AS collector_last,
-            s.created_at
-        FROM signatures s
-        LEFT JOIN voters     v ON v.sos_voterid = s.sos_voterid
-        LEFT JOIN books      b ON b.id = s.book_id
-        LEFT JOIN collectors c ON c.id = b.collector_id
-        WHERE s.matched = TRUE
-        ORDER BY b.book_number, s.id
-    """)).fetchall()
-
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow([
-        "sos_voterid",
-        "first_name",
-        "last_name",
-        "full_address",
-        "address1",
-        "address2",
-        "city",
-        "state",
-        "zip",
-        "registered_city",
-        "book_number",
-        "collector",
-        "date_entered",
-    ])
-    for r in rows:
-        collector = " ".join(filter(None, [r.collector_first, r.collector_last]))
-        street = " ".join(filter(None, [r.residential_address1, r.residential_address2]))
-        city_state_zip = ", ".join(filter(None, [
-            r.residential_city,
-            " ".join(filter(None, [r.residential_state, r.residential_zip])),
-        ]))
-        full_address = ", ".join(filter(None, [street, city_state_zip]))
-        writer.writerow([
-            r.sos_voterid or "",
-            r.first_name or "",
-            r.last_name or "",
-            full_address,
-            r.residential_address1 or "",
-            r.residential_address2 or "",
-            r.residential_city or "",
-            r.residential_state or "",
-            r.residential_zip or "",
-            r.registered_city or "",
-            r.book_number or "",
-            collector,
-            r.created_at.strftime("%Y-%m-%d %H:%M") if r.created_at else "",
-        ])
-
-    filename = f"matched-signatures-{date.today()}.csv"
-    return Response(
-        buf.getvalue(),
+    """Download matched signatures as a CSV including sos_voterid and voter names.
+
+    The CSV is built into ``EXPORT_FOLDER`` and served from disk until a
+    signature is matched or it is ``EXPORT_MAX_AGE`` seconds old. Responses
+    carry an ETag, so re-downloading an unchanged export gets a 304.
+    """
+    folder = current_app.config["EXPORT_FOLDER"]
+    # Exports hold voter names and addresses; don't keep them past their use
+    _prune_exports(folder)
+
+    count, last_id = db.session.execute(_MATCHED_EXPORT_VERSION_SQL).one()
+    path = os.path.join(folder, f"matched-signatures-{count}-{last_id}.csv")
+
+    try:
+        fresh = time.time() - os.path.getmtime(path) < EXPORT_MAX_AGE
+    except OSError:
+        fresh = False
+    if not fresh:
+        _build_matched_csv(path)
+
+    try:
+        return _send_matched_csv(path)
+    except FileNotFoundError:
+        # A concurrent rebuild pruned it between the freshness check and here
+        _build_matched_csv(path)
+        return _send_matched_csv(path)
+
+
+def _send_matched_csv(path):
+    return send_file(
+        path,
         mimetype="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        as_attachment=True,
+        download_name=f"matched-signatures-{date.today()}.csv",
+        conditional=True,
+        max_age=0,
     )
 
 
+def _build_matched_csv(path):
+    """Write the matched-signatures export to *path*.
+
+    Postgres renders the CSV with ``COPY ... TO STDOUT``, so no rows pass
+    through Python. The file is written beside *path* and renamed into
+    place, so concurrent downloads never see a partial file.
+    """
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            dbapi_conn = db.session.connection().connection.dbapi_connection
+            with dbapi_conn.cursor() as cursor:
+                cursor.copy_expert(_MATCHED_EXPORT_COPY, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _prune_exports(folder):
+    """Remove builds and leftover temp files older than ``EXPORT_MAX_AGE``.
+
+    Past that age a build can no longer pass the freshness check, so no
+    download is about to open it.
+    """
+    cutoff = time.time() - EXPORT_MAX_AGE
+    for pattern in ("matched-signatures-*.csv", "*.tmp"):
+        for old_path in glob.glob(os.path.join(folder, pattern)):
+            try:
+                if os.path.getmtime(old_path) < cutoff:
+                    os.remove(old_path)
+            except OSError:
+                pass
+
+
 @bp.route("/books")
 @login_required
 def books():
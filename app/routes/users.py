@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.models import User, UserRole, Organization, admin_required, organizer_required
@@ -7,13 +8,25 @@ from app.utils import is_valid_email
 
 bp = Blueprint("users", __name__)
 
+# Roles an organizer may assign: everything but Administrator
+_ORGANIZER_ROLES = [c for c in UserRole.CHOICES if c[0] != UserRole.ADMIN]
+
+
+def _available_roles():
+    """Roles the current user may assign."""
+    return UserRole.CHOICES if current_user.is_admin else _ORGANIZER_ROLES
+
 
 @bp.route("/")
 @login_required
 @organizer_required
 def index():
     """List all users."""
-    users = User.query.order_by(User.last_name, User.first_name).all()
+    users = (
+        User.query.options(joinedload(User.organization))
+        .order_by(User.last_name, User.first_name)
+        .all()
+    )
     return render_template("users/index.html", users=users)
 
 
@@ -22,11 +35,9 @@ def index():
 @organizer_required
 def new():
     """Create a new user."""
-    organizations = Organization.query.order_by(Organization.name).all()
+    organizations = Organization.choices()
     # Organizers cannot assign the Admin role
-    available_roles = UserRole.CHOICES if current_user.is_admin else [
-        c for c in UserRole.CHOICES if c[0] != UserRole.ADMIN
-    ]
+    available_roles = _available_roles()
 
     if request.method == "POST":
         email = request.form.get("email", "").strip()
@@ -46,7 +57,7 @@ def new():
             flash("Invalid email address.", "error")
             return render_template("users/new.html", roles=available_roles, organizations=organizations)
 
-        if User.query.filter_by(email=email).first():
+        if db.session.execute(db.select(db.exists().where(User.email == email))).scalar():
             flash("Email already registered", "error")
             return render_template("users/new.html", roles=available_roles, organizations=organizations)
 
@@ -74,7 +85,7 @@ def new():
 def edit(id):
     """Edit a user."""
     user = db.session.get(User, id)
-    organizations = Organization.query.order_by(Organization.name).all()
+    organizations = Organization.choices()
 
     if not user:
         flash("User not found", "error")
@@ -86,9 +97,7 @@ def edit(id):
         return redirect(url_for("users.index"))
 
     # Organizers cannot assign the Admin role
-    available_roles = UserRole.CHOICES if current_user.is_admin else [
-        c for c in UserRole.CHOICES if c[0] != UserRole.ADMIN
-    ]
+    available_roles = _available_roles()
 
     if request.method == "POST":
         email = request.form.get("email", "").strip()
@@ -128,25 +137,34 @@ def edit(id):
 @organizer_required
 def toggle_active(id):
     """Toggle user active status."""
-    user = db.session.get(User, id)
-
-    if not user:
-        flash("User not found", "error")
+    # Prevent deactivating yourself
+    if id == current_user.id:
+        flash("You cannot deactivate your own account", "error")
         return redirect(url_for("users.index"))
 
+    # Flip the flag in a single UPDATE ... RETURNING, so concurrent toggles
+    # can't both read the old value
+    stmt = (
+        db.update(User)
+        .where(User.id == id)
+        .values(is_active=~db.func.coalesce(User.is_active, False))
+        .returning(User.first_name, User.last_name, User.is_active)
+    )
     # Organizers cannot toggle admin accounts
-    if not current_user.is_admin and user.is_admin:
-        flash("You don't have permission to modify an Administrator account.", "error")
-        return redirect(url_for("users.index"))
-
-    # Prevent deactivating yourself
-    if user.id == current_user.id:
-        flash("You cannot deactivate your own account", "error")
+    if not current_user.is_admin:
+        stmt = stmt.where(User.role != UserRole.ADMIN)
+    row = db.session.execute(stmt).first()
+
+    if row is None:
+        db.session.rollback()
+        if db.session.execute(db.select(db.exists().where(User.id == id))).scalar():
+            flash("You don't have permission to modify an Administrator account.", "error")
+        else:
+            flash("User not found", "error")
         return redirect(url_for("users.index"))
 
-    user.is_active = not user.is_active
     db.session.commit()
 
-    status = "activated" if user.is_active else "deactivated"
-    flash(f"User {user.full_name} {status}", "success")
+    status = "activated" if row.is_active else "deactivated"
+    flash(f"User {row.first_name} {row.last_name} {status}", "success")
     return redirect(url_for("users.index"))
@@ -1,14 +1,19 @@
 """Database backup service: pg_dump specific tables and upload via SFTP."""
 
+import base64
+import hashlib
 import io
 import logging
 import os
 import posixpath
 import re
+import shutil
 import subprocess
 import tempfile
 import threading
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +30,35 @@ BACKUP_TABLES = [
     "settings",
     "voter_imports",
 ]
+# pg_dump reads --table as an anchored pattern in which regex alternation
+# works, so one pattern selects every table in a single catalog query.
+_TABLE_PATTERN = "(" + "|".join(BACKUP_TABLES) + ")"
+
+# Compression levels for the backup_compression setting. "none" suits a
+# backup target on a fast local link, where compressing only costs CPU.
+COMPRESSION_CHOICES = ("none", "fast", "best")
+_ZSTD_LEVELS = {"fast": 3, "best": 9}
+_GZIP_LEVELS = {"fast": 1, "best": 9}
+
+# A running backup holds this session-level advisory lock, like the
+# scheduler leader and voter imports do. The lock, not the status setting,
+# decides whether a backup may start: taking it is atomic, and Postgres
+# drops it if the worker dies mid-backup.
+_BACKUP_LOCK_KEY = 0x50514303  # arbitrary, unique to petition-qc
 
 
 def is_configured() -> bool:
     """Return True if all required backup settings are present."""
     from app.models import Settings
 
-    return all(
-        Settings.get(k)
-        for k in (
-            "backup_scp_host",
-            "backup_scp_user",
-            "backup_scp_key_content",
-            "backup_scp_remote_path",
-        )
-    )
+    required = [
+        "backup_scp_host",
+        "backup_scp_user",
+        "backup_scp_key_content",
+        "backup_scp_remote_path",
+    ]
+    values = Settings.get_many(required)
+    return all(values.get(k) for k in required)
 
 
 def run_backup_async(app) -> None:
@@ -50,67 +69,120 @@ def run_backup_async(app) -> None:
 
     Raises ValueError if backup is not configured or already running.
     """
-    from app.models import Settings
-
     if not is_configured():
         raise ValueError("Backup is not fully configured.")
 
-    current_status = Settings.get("backup_last_status", "")
-    if current_status == "running":
+    lock_conn = _claim_backup()
+    if lock_conn is None:
         raise ValueError("A backup is already in progress.")
 
-    Settings.set("backup_last_status", "running")
-    Settings.set("backup_last_run", datetime.now().isoformat())
-
-    thread = threading.Thread(target=_backup_thread, args=(app,), daemon=True)
+    thread = threading.Thread(target=_backup_thread, args=(app, lock_conn), daemon=True)
     thread.start()
 
 
-def _backup_thread(app) -> None:
-    """Background thread: dump the database and upload via SFTP."""
+def _claim_backup():
+    """Take the backup lock and mark a backup as running.
+
+    Returns the connection holding the lock, which the caller hands to
+    ``_do_backup``, or None if another backup holds it.
+    """
+    from app import db
+    from app.models import Settings
+    from sqlalchemy import text
+
+    lock_conn = db.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        locked = lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": _BACKUP_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            lock_conn.close()
+            return None
+
+        if Settings.get("backup_last_status", "") == "running":
+            logger.warning("Previous backup never finished (its worker exited); starting anew.")
+        Settings.set_many({
+            "backup_last_status": "running",
+            "backup_last_run": datetime.now().isoformat(),
+        })
+    except BaseException:
+        _release_backup_lock(lock_conn)
+        raise
+    return lock_conn
+
+
+def _release_backup_lock(lock_conn) -> None:
+    """Release the backup lock and return its connection to the pool."""
+    from sqlalchemy import text
+
+    try:
+        lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _BACKUP_LOCK_KEY})
+    finally:
+        lock_conn.close()
+
+
+def _backup_thread(app, lock_conn) -> None:
+    """Background thread: run a claimed backup in its own app context."""
     with app.app_context():
-        from app import db
-        from app.models import Settings
-        from sqlalchemy import text
+        _do_backup(app, lock_conn)
 
-        db_url = os.environ.get("DATABASE_URL") or app.config.get(
-            "SQLALCHEMY_DATABASE_URI", ""
-        )
-        scp_config = {
-            "host": Settings.get("backup_scp_host"),
-            "port": int(Settings.get("backup_scp_port", "22") or "22"),
-            "user": Settings.get("backup_scp_user"),
-            "key_content": Settings.get("backup_scp_key_content"),
-            "remote_path": Settings.get("backup_scp_remote_path"),
-        }
-
-        # Determine the PostgreSQL server major version so we can pick the
-        # matching pg_dump binary (avoids "server version mismatch" errors).
-        try:
-            version_num = db.session.execute(
-                text("SHOW server_version_num")
-            ).scalar()
-            server_major = int(version_num) // 10000
-        except Exception:
-            server_major = None
 
-        schedule = Settings.get("backup_schedule", "")
+def _do_backup(app, lock_conn) -> None:
+    """Run a claimed backup, then release its lock (inside an app context)."""
+    try:
+        _run_backup(app)
+    finally:
+        _release_backup_lock(lock_conn)
 
-        dump_file = None
-        try:
-            dump_file = _create_pg_dump(db_url, server_major)
-            _sftp_upload(dump_file, scp_config, schedule=schedule)
-            Settings.set("backup_last_status", "success")
-        except Exception as exc:
-            logger.exception("Backup failed")
-            # Truncate long error messages to fit in the settings value column
-            Settings.set("backup_last_status", f"error:{str(exc)[:300]}")
-        finally:
-            if dump_file and os.path.exists(dump_file):
-                try:
-                    os.unlink(dump_file)
-                except OSError:
-                    pass
+
+def _run_backup(app) -> None:
+    """Dump the database and upload via SFTP (inside an app context)."""
+    from app import db
+    from app.models import Settings
+    from sqlalchemy import text
+
+    db_url = os.environ.get("DATABASE_URL") or app.config.get(
+        "SQLALCHEMY_DATABASE_URI", ""
+    )
+    values = Settings.get_many([
+        "backup_scp_host",
+        "backup_scp_port",
+        "backup_scp_user",
+        "backup_scp_key_content",
+        "backup_scp_remote_path",
+        "backup_schedule",
+        "backup_compression",
+    ])
+    scp_config = {
+        "host": values.get("backup_scp_host"),
+        "port": int(values.get("backup_scp_port", "22") or "22"),
+        "user": values.get("backup_scp_user"),
+        "key_content": values.get("backup_scp_key_content"),
+        "remote_path": values.get("backup_scp_remote_path"),
+    }
+
+    # Determine the PostgreSQL server major version so we can pick the
+    # matching pg_dump binary (avoids "server version mismatch" errors).
+    try:
+        version_num = db.session.execute(
+            text("SHOW server_version_num")
+        ).scalar()
+        server_major = int(version_num) // 10000
+    except Exception:
+        server_major = None
+
+    schedule = values.get("backup_schedule", "")
+    compression = values.get("backup_compression", "fast")
+
+    try:
+        _stream_pg_dump_to_sftp(
+            db_url, scp_config, server_major, schedule=schedule, compression=compression
+        )
+        Settings.set("backup_last_status", "success")
+    except Exception as exc:
+        logger.exception("Backup failed")
+        # Truncate long error messages to fit in the settings value column
+        Settings.set("backup_last_status", f"error:{str(exc)[:300]}")
 
 
 def _find_pg_dump(server_major: int | None) -> str:
@@ -120,8 +192,6 @@ def _find_pg_dump(server_major: int | None) -> str:
     /usr/lib/postgresql/{version}/bin/pg_dump.  Falls back to whatever
     'pg_dump' resolves to in PATH if no versioned binary is found.
     """
-    import shutil
-
     if server_major:
         versioned = f"/usr/lib/postgresql/{server_major}/bin/pg_dump"
         if os.path.isfile(versioned) and os.access(versioned, os.X_OK):
@@ -138,47 +208,90 @@ def _find_pg_dump(server_major: int | None) -> str:
     return default
 
 
-def _create_pg_dump(db_url: str, server_major: int | None = None) -> str:
-    """Run pg_dump for BACKUP_TABLES only and return the path to the dump file."""
-    # Strip SQLAlchemy driver prefixes (e.g. postgresql+psycopg2://)
-    clean_url = db_url.replace("+psycopg2", "").replace("+pg8000", "")
+@lru_cache(maxsize=None)
+def _pg_dump_supports_zstd(pg_dump: str) -> bool:
+    """Return True if *pg_dump* can write zstd-compressed archives itself.
+
+    That needs pg_dump 16+ built with zstd. Older versions read
+    ``--compress=zstd:N`` as level 0 rather than rejecting it, so the
+    version is checked first. The compression spec is checked before
+    pg_dump connects, so probing against a socket directory that can't
+    exist tells the build apart without touching a server; the probe runs
+    under the C locale so its error message can be matched.
+    """
+    env = {**os.environ, "LC_ALL": "C"}
+    try:
+        version = subprocess.run(
+            [pg_dump, "--version"], capture_output=True, text=True, timeout=10, env=env
+        )
+        # "pg_dump (PostgreSQL) 16.2 (Ubuntu 16.2-1.pgdg22.04+1)"
+        match = re.search(r"\)\s*(\d+)", version.stdout)
+        if not match or int(match.group(1)) < 16:
+            return False
+        probe = subprocess.run(
+            [pg_dump, "--format=custom", "--compress=zstd:3", "--file", os.devnull,
+             "--dbname", "postgresql:///probe?host=/nonexistent-petition-qc"],
+            capture_output=True, text=True, timeout=10, env=env,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "compress" not in probe.stderr.lower()
 
-    pg_dump = _find_pg_dump(server_major)
 
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    fd, dump_path = tempfile.mkstemp(suffix=f"-petition-qc-{timestamp}.dump")
-    os.close(fd)
+def _libpq_url(db_url: str) -> str:
+    """Drop the SQLAlchemy driver suffix (``postgresql+psycopg2://``) from a URL."""
+    scheme, sep, rest = db_url.partition("://")
+    return scheme.partition("+")[0] + sep + rest
+
+
+def _pg_dump_command(
+    db_url: str, server_major: int | None = None, compression: str = "fast"
+) -> tuple[list[str], list[str] | None]:
+    """Return the pg_dump command line for BACKUP_TABLES and its compressor.
+
+    zstd compresses several times faster than gzip at a similar ratio.
+    pg_dump does it itself when it can; otherwise it writes an uncompressed
+    archive for the zstd CLI to compress (the returned compressor command),
+    and without either it falls back to gzip at the matching level.
+    """
+    clean_url = _libpq_url(db_url)
+
+    pg_dump = _find_pg_dump(server_major)
 
     # Pass the full URI via --dbname so pg_dump receives the password and all
     # connection parameters exactly as SQLAlchemy uses them.
-    cmd = [pg_dump, "--format=custom", "--dbname", clean_url]
-    for table in BACKUP_TABLES:
-        cmd.extend(["--table", table])
-
-    with open(dump_path, "wb") as f:
-        result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE)
-
-    if result.returncode != 0:
-        os.unlink(dump_path)
-        stderr = result.stderr.decode().strip()
-        # Provide an actionable message when the version mismatch is the cause.
-        if "server version mismatch" in stderr and server_major:
-            raise RuntimeError(
-                f"pg_dump version mismatch (server is PostgreSQL {server_major}). "
-                f"Install the matching client: sudo apt install postgresql-client-{server_major}"
-            )
-        raise RuntimeError(
-            f"pg_dump exited with code {result.returncode}: {stderr}"
+    cmd = [pg_dump, "--format=custom", "--dbname", clean_url, "--table", _TABLE_PATTERN]
+
+    if compression not in _ZSTD_LEVELS:
+        cmd.append("--compress=0")
+    elif _pg_dump_supports_zstd(pg_dump):
+        cmd.append(f"--compress=zstd:{_ZSTD_LEVELS[compression]}")
+    elif zstd := shutil.which("zstd"):
+        cmd.append("--compress=0")
+        return cmd, [zstd, "-T0", f"-{_ZSTD_LEVELS[compression]}", "-q", "-c", "-"]
+    else:
+        cmd.append(f"--compress={_GZIP_LEVELS[compression]}")
+    return cmd, None
+
+
+def _pg_dump_error(returncode: int, stderr: str, server_major: int | None) -> RuntimeError:
+    """Build the error raised for a failed pg_dump run."""
+    # Provide an actionable message when the version mismatch is the cause.
+    if "server version mismatch" in stderr and server_major:
+        return RuntimeError(
+            f"pg_dump version mismatch (server is PostgreSQL {server_major}). "
+            f"Install the matching client: sudo apt install postgresql-client-{server_major}"
         )
-
-    return dump_path
+    return RuntimeError(f"pg_dump exited with code {returncode}: {stderr}")
 
 
+@lru_cache(maxsize=4)
 def _load_pkey(key_content: str):
     """Load a paramiko PKey from a PEM/OpenSSH string, trying all key types.
 
     Normalises line endings first so browser-uploaded files work regardless
-    of whether they were saved with LF or CRLF.
+    of whether they were saved with LF or CRLF. Parsed keys are cached by
+    content, so repeated backups and connection tests skip the parse.
     """
     import paramiko
 
@@ -198,6 +311,19 @@ def _load_pkey(key_content: str):
     )
 
 
+def key_fingerprint(key_content: str) -> str:
+    """Return the SHA-256 fingerprint of a private key (OpenSSH format)."""
+    try:
+        pkey = _load_pkey(key_content)
+        digest = hashlib.sha256(pkey.asbytes()).digest()
+        return "SHA256:" + base64.b64encode(digest).decode().rstrip("=")
+    except Exception:
+        return "(error computing fingerprint)"
+
+
+SSH_KEEPALIVE_INTERVAL = 30  # seconds
+
+
 def _make_ssh_client(scp_config: dict, timeout: int):
     """Return a connected paramiko SSHClient using the stored private key.
 
@@ -219,9 +345,50 @@ def _make_ssh_client(scp_config: dict, timeout: int):
         allow_agent=False,
         timeout=timeout,
     )
+    # The upload channel opens before pg_dump writes anything; keepalives
+    # stop NAT/firewall idle timeouts from dropping it while the dump waits
+    # on locks or compresses a large table.
+    client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
     return client
 
 
+# Connection tests log through their own paramiko channel, kept at DEBUG
+# and out of the app's handlers, so a backup running meanwhile doesn't log
+# its handshake too.
+_TEST_LOG_CHANNEL = "paramiko.connection_test"
+_test_log = logging.getLogger(_TEST_LOG_CHANNEL)
+_test_log.setLevel(logging.DEBUG)
+_test_log.propagate = False
+
+
+class _AuthLogBuffer(logging.Handler):
+    """Keep the last few auth-related log lines from a connection test.
+
+    Concurrent tests share the channel, so a buffer only accepts records
+    from the thread running its test and from that test's SSH transport.
+    """
+
+    KEYWORDS = ("userauth", "auth", "pubkey", "allowed", "banner", "service")
+
+    def __init__(self, maxlen: int = 12):
+        super().__init__(logging.DEBUG)
+        self.lines = deque(maxlen=maxlen)
+        self.thread = threading.current_thread()
+        self.client = None
+
+    def filter(self, record):
+        # paramiko's Transport is itself the thread that logs the handshake
+        current = threading.current_thread()
+        return current is self.thread or (
+            self.client is not None and current is self.client.get_transport()
+        )
+
+    def emit(self, record):
+        message = record.getMessage()
+        if any(kw in message.lower() for kw in self.KEYWORDS):
+            self.lines.append(message)
+
+
 def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple[bool, str]:
     """Attempt an SSH connection and return (success, message).
 
@@ -234,16 +401,18 @@ def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple
 
     The first strategy that succeeds is reported.  If all three fail the
     combined error messages are returned so the caller can see exactly where
-    negotiation is breaking down.
+    negotiation is breaking down.  A failure before authentication (host
+    unreachable, connection refused or reset) ends the test at once, since
+    the other strategies would only repeat it.
     """
     import paramiko
 
     host = scp_config["host"]
 
     if password:
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             client.connect(
                 host,
                 port=scp_config["port"],
@@ -253,25 +422,21 @@ def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple
                 allow_agent=False,
                 timeout=8,
             )
-            client.close()
             return True, f"Connected to {host} via password successfully."
         except Exception as exc:
             return False, f"Password auth failed: {exc}"
+        finally:
+            client.close()
 
     try:
         pkey = _load_pkey(scp_config["key_content"])
     except ValueError as exc:
         return False, str(exc)
 
-    # Capture paramiko's transport-level DEBUG log for the first attempt so
-    # the caller can see exactly what the server is accepting/rejecting.
-    log_stream = io.StringIO()
-    log_handler = logging.StreamHandler(log_stream)
-    log_handler.setLevel(logging.DEBUG)
-    paramiko_log = logging.getLogger("paramiko")
-    original_level = paramiko_log.level
-    paramiko_log.setLevel(logging.DEBUG)
-    paramiko_log.addHandler(log_handler)
+    # Capture paramiko's transport-level DEBUG log for the attempts so the
+    # caller can see exactly what the server is accepting/rejecting.
+    auth_log = _AuthLogBuffer()
+    _test_log.addHandler(auth_log)
 
     strategies = [
         ("Auto (rsa-sha2-512/256/ssh-rsa)",    {}),
@@ -283,6 +448,8 @@ def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple
         for label, extra_kwargs in strategies:
             client = paramiko.SSHClient()
             client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.set_log_channel(_TEST_LOG_CHANNEL)
+            auth_log.client = client
             try:
                 client.connect(
                     host,
@@ -294,22 +461,21 @@ def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple
                     timeout=8,
                     **extra_kwargs,
                 )
-                client.close()
                 return True, f"Connected to {host} successfully [{label}]."
             except Exception as exc:
                 errors.append(f"{label}: {exc}")
+                transport = client.get_transport()
+                if transport is None or not transport.is_active():
+                    # Failed before authentication (refused, unreachable,
+                    # timed out, bad banner); the strategies only differ
+                    # in how they authenticate.
+                    break
             finally:
                 client.close()
     finally:
-        paramiko_log.removeHandler(log_handler)
-        paramiko_log.setLevel(original_level)
+        _test_log.removeHandler(auth_log)
 
-    # Extract auth-relevant log lines to include in the error message.
-    auth_lines = [
-        line for line in log_stream.getvalue().splitlines()
-        if any(kw in line.lower() for kw in ("userauth", "auth", "pubkey", "allowed", "banner", "service"))
-    ]
-    debug_snippet = " // ".join(auth_lines[-12:]) if auth_lines else ""
+    debug_snippet = " // ".join(auth_log.lines)
 
     summary = " | ".join(errors)
     if debug_snippet:
@@ -320,38 +486,59 @@ def test_sftp_connection(scp_config: dict, password: str | None = None) -> tuple
 def run_backup_sync(app) -> None:
     """Run a full backup synchronously (for use by the scheduler)."""
     with app.app_context():
-        from app.models import Settings
-
         if not is_configured():
             logger.warning("Scheduled backup skipped: not configured.")
             return
-        if Settings.get("backup_last_status") == "running":
+        lock_conn = _claim_backup()
+        if lock_conn is None:
             logger.warning("Scheduled backup skipped: already running.")
             return
-        Settings.set("backup_last_status", "running")
-        Settings.set("backup_last_run", datetime.now().isoformat())
-
-    _backup_thread(app)
+        _do_backup(app, lock_conn)
 
 
 # ---------------------------------------------------------------------------
 # Retention helpers
 # ---------------------------------------------------------------------------
 
-_BACKUP_RE = re.compile(r"^petition-qc-backup-(\d{8})-(\d{6})\.dump$")
+# Backup names are fixed-width: petition-qc-backup-YYYYMMDD-HHMMSS.dump[.zst]
+_BACKUP_PREFIX = "petition-qc-backup-"
+_BACKUP_SUFFIXES = (".dump", ".dump.zst")
 
 
 def _parse_backup_dt(filename: str) -> datetime | None:
-    """Parse the timestamp embedded in a backup filename, or return None."""
-    m = _BACKUP_RE.match(filename)
-    if not m:
+    """Parse the timestamp embedded in a backup filename, or return None.
+
+    Runs once per file in the remote directory, so the fields are sliced at
+    fixed offsets rather than matched with a regex and strptime.
+    """
+    if not filename.startswith(_BACKUP_PREFIX):
+        return None
+    start = len(_BACKUP_PREFIX)
+    stamp = filename[start:start + 15]
+    digits = stamp[:8] + stamp[9:]
+    if (
+        filename[start + 15:] not in _BACKUP_SUFFIXES
+        or stamp[8:9] != "-"
+        or not (digits.isascii() and digits.isdigit())
+    ):
         return None
     try:
-        return datetime.strptime(m.group(1) + m.group(2), "%Y%m%d%H%M%S")
+        return datetime(
+            int(stamp[0:4]), int(stamp[4:6]), int(stamp[6:8]),
+            int(stamp[9:11]), int(stamp[11:13]), int(stamp[13:15]),
+        )
     except ValueError:
         return None
 
 
+# Backups kept per schedule: (most recent, daily slots, weekly slots)
+_RETENTION = {
+    "hourly": (12, 7, 4),
+    "daily": (7, 0, 4),
+    "weekly": (4, 0, 0),
+}
+
+
 def _apply_retention(sftp, remote_dir: str, schedule: str) -> None:
     """Delete remote backup files that fall outside the retention policy.
 
@@ -362,7 +549,7 @@ def _apply_retention(sftp, remote_dir: str, schedule: str) -> None:
     daily  : last 7 dailies    +  last 4 weekly (Sun 02:00) slots
     weekly : last 4 weeklies
     """
-    if schedule not in ("hourly", "daily", "weekly"):
+    if schedule not in _RETENTION:
         return
 
     try:
@@ -377,61 +564,119 @@ def _apply_retention(sftp, remote_dir: str, schedule: str) -> None:
         reverse=True,
     )
 
+    # One pass, newest first: the most recent backups, plus the newest
+    # daily (02:00) and weekly (Sunday 02:00) slots, up to each bound.
+    n_recent, n_daily, n_weekly = _RETENTION[schedule]
     keep: set[str] = set()
-
-    if schedule == "hourly":
-        # Last 12 hourlies (any time)
-        for _, name in backups[:12]:
-            keep.add(name)
-        # Last 7 daily slots (02:00 UTC, any weekday)
-        dailies = [(dt, n) for dt, n in backups if dt.hour == 2 and dt.minute == 0]
-        for _, name in dailies[:7]:
-            keep.add(name)
-        # Last 4 weekly slots (Sunday 02:00 UTC)
-        weeklies = [(dt, n) for dt, n in dailies if dt.weekday() == 6]
-        for _, name in weeklies[:4]:
-            keep.add(name)
-
-    elif schedule == "daily":
-        # Last 7 dailies (any time, since only one runs per day)
-        for _, name in backups[:7]:
-            keep.add(name)
-        # Last 4 weekly slots (Sunday 02:00 UTC)
-        weeklies = [(dt, n) for dt, n in backups if dt.weekday() == 6 and dt.hour == 2 and dt.minute == 0]
-        for _, name in weeklies[:4]:
-            keep.add(name)
-
-    elif schedule == "weekly":
-        # Last 4 weeklies
-        for _, name in backups[:4]:
+    dailies = weeklies = 0
+    for i, (dt, name) in enumerate(backups):
+        if i < n_recent:
             keep.add(name)
-
-    for dt, name in backups:
-        if name not in keep:
-            path = posixpath.join(remote_dir, name)
-            try:
-                sftp.remove(path)
-                logger.info("Retention: removed %s", name)
-            except Exception as exc:
-                logger.warning("Retention: could not remove %s: %s", name, exc)
+        if dt.hour == 2 and dt.minute == 0:
+            if dailies < n_daily:
+                keep.add(name)
+            dailies += 1
+            if dt.weekday() == 6:
+                if weeklies < n_weekly:
+                    keep.add(name)
+                weeklies += 1
+
+    for _, name in backups:
+        if name in keep:
+            continue
+        try:
+            sftp.remove(posixpath.join(remote_dir, name))
+            logger.info("Retention: removed %s", name)
+        except Exception as exc:
+            logger.warning("Retention: could not remove %s: %s", name, exc)
 
 
 # ---------------------------------------------------------------------------
 # SFTP upload
 # ---------------------------------------------------------------------------
 
-def _sftp_upload(local_path: str, scp_config: dict, schedule: str = "") -> None:
-    """Upload *local_path* to the remote server and apply the retention policy."""
+# paramiko's defaults copy OpenSSH's (2 MiB window, 32 KiB packets), which
+# leave a long-latency link idle while waiting on window adjustments.
+SFTP_WINDOW_SIZE = 64 * 1024 * 1024
+SFTP_MAX_PACKET_SIZE = 256 * 1024
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+
+def _stream_pg_dump_to_sftp(
+    db_url: str,
+    scp_config: dict,
+    server_major: int | None = None,
+    schedule: str = "",
+    compression: str = "fast",
+) -> None:
+    """Pipe pg_dump straight to the remote server and apply the retention policy.
+
+    The dump is never staged on local disk, so a backup costs no /tmp space
+    and each byte is moved once instead of written, re-read and sent.
+    """
+    import paramiko
+
+    cmd, compress_cmd = _pg_dump_command(db_url, server_major, compression)
+
     client = _make_ssh_client(scp_config, timeout=30)
     try:
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        remote_filename = f"petition-qc-backup-{timestamp}.dump"
+        # .zst archives need `zstd -dc` in front of pg_restore
+        suffix = ".dump.zst" if compress_cmd else ".dump"
+        remote_filename = f"petition-qc-backup-{timestamp}{suffix}"
         remote_dir = scp_config["remote_path"].rstrip("/")
         remote_path = posixpath.join(remote_dir, remote_filename)
 
-        sftp = client.open_sftp()
-        sftp.put(local_path, remote_path)
+        sftp = paramiko.SFTPClient.from_transport(
+            client.get_transport(),
+            window_size=SFTP_WINDOW_SIZE,
+            max_packet_size=SFTP_MAX_PACKET_SIZE,
+        )
+        # stderr goes to a file rather than a pipe: nothing drains a pipe
+        # while stdout is being uploaded, so a chatty pg_dump could stall.
+        with tempfile.TemporaryFile() as err:
+            procs = [subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=err, bufsize=1 << 20
+            )]
+            if compress_cmd:
+                procs.append(subprocess.Popen(
+                    compress_cmd, stdin=procs[0].stdout, stdout=subprocess.PIPE,
+                    stderr=err, bufsize=1 << 20,
+                ))
+                # zstd holds the read end now; dropping ours lets pg_dump
+                # get SIGPIPE instead of blocking if zstd dies.
+                procs[0].stdout.close()
+            try:
+                # Writes are pipelined (no wait for each ack) and moved in
+                # 1 MiB blocks; paramiko splits them into SFTP requests.
+                with sftp.open(remote_path, "wb", bufsize=UPLOAD_BLOCK_SIZE) as remote:
+                    remote.set_pipelined(True)
+                    shutil.copyfileobj(procs[-1].stdout, remote, UPLOAD_BLOCK_SIZE)
+            except BaseException:
+                for proc in procs:
+                    proc.kill()
+                _remove_partial(sftp, remote_path)
+                raise
+            finally:
+                procs[-1].stdout.close()
+                dump_code, *compress_codes = [proc.wait() for proc in procs]
+
+            if dump_code or any(compress_codes):
+                _remove_partial(sftp, remote_path)
+                err.seek(0)
+                stderr = err.read().decode(errors="replace").strip()
+                if dump_code:
+                    raise _pg_dump_error(dump_code, stderr, server_major)
+                raise RuntimeError(f"zstd exited with code {compress_codes[0]}: {stderr}")
+
         _apply_retention(sftp, remote_dir, schedule)
         sftp.close()
     finally:
         client.close()
+
+
+def _remove_partial(sftp, remote_path: str) -> None:
+    """Best-effort removal of a truncated upload."""
+    try:
+        sftp.remove(remote_path)
+    except Exception as exc:
+        logger.warning("Could not remove partial backup %s: %s", remote_path, exc)
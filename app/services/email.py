@@ -2,6 +2,7 @@
 
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -12,22 +13,29 @@ def is_configured() -> bool:
     """Return True if all required SMTP settings are present."""
     from app.models import Settings
 
-    return all(
-        Settings.get(k)
-        for k in ("smtp_host", "smtp_user", "smtp_from_email")
-    )
+    required = ["smtp_host", "smtp_user", "smtp_from_email"]
+    values = Settings.get_many(required)
+    return all(values.get(k) for k in required)
 
 
 def send_email(to: str, subject: str, body_html: str, body_text: str) -> None:
     """Send an email via SMTP. Raises on failure."""
     from app.models import Settings
 
-    host = Settings.get("smtp_host", "")
-    port = int(Settings.get("smtp_port", "587") or "587")
-    user = Settings.get("smtp_user", "")
-    password = Settings.get("smtp_password", "")
-    from_email = Settings.get("smtp_from_email", "")
-    use_tls = Settings.get("smtp_use_tls", "true").lower() != "false"
+    values = Settings.get_many([
+        "smtp_host",
+        "smtp_port",
+        "smtp_user",
+        "smtp_password",
+        "smtp_from_email",
+        "smtp_use_tls",
+    ])
+    host = values.get("smtp_host", "")
+    port = int(values.get("smtp_port", "587") or "587")
+    user = values.get("smtp_user", "")
+    password = values.get("smtp_password", "")
+    from_email = values.get("smtp_from_email", "")
+    use_tls = values.get("smtp_use_tls", "true").lower() != "false"
 
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
@@ -41,7 +49,8 @@ def send_email(to: str, subject: str, body_html: str, body_text: str) -> None:
             smtp.starttls()
         if user and password:
             smtp.login(user, password)
-        smtp.sendmail(from_email, [to], msg.as_string())
+        # Serialized straight to bytes, without an intermediate str
+        smtp.send_message(msg, from_email, [to])
 
     logger.info("Email sent to %s: %s", to, subject)
 
@@ -62,3 +71,20 @@ def send_password_reset_email(to: str, reset_url: str) -> None:
 <p>If you did not request this, you can safely ignore this email.</p>
 """
     send_email(to, subject, body_html, body_text)
+
+
+def send_password_reset_email_async(app, to: str, reset_url: str) -> None:
+    """Send a password reset email from a background thread.
+
+    The SMTP connect, STARTTLS and login take several round trips; keeping
+    them off the request also stops the response time from revealing
+    whether the address belongs to an account.
+    """
+    def send():
+        with app.app_context():
+            try:
+                send_password_reset_email(to, reset_url)
+            except Exception:
+                logger.exception("Failed to send password reset email to %s", to)
+
+    threading.Thread(target=send, daemon=True).start()
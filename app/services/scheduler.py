@@ -4,30 +4,80 @@ import logging
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
 _scheduler = BackgroundScheduler(timezone="UTC")
 _JOB_ID = "scheduled_backup"
+_SYNC_JOB_ID = "scheduler_sync"
+_SYNC_INTERVAL_SECONDS = 60
+
+# Every Gunicorn worker runs create_app, but only one of them may run
+# backups. Workers compete for this session-level advisory lock; the winner
+# keeps the connection open for as long as it leads, and Postgres releases
+# the lock if that process dies so another worker takes over on its next sync.
+_LEADER_LOCK_KEY = 0x50514301  # arbitrary, unique to petition-qc
+_leader_conn = None
+
+# Triggers only compute fire times, so one instance per schedule is shared
+_TRIGGERS = {
+    "hourly": CronTrigger(minute=0),
+    "daily": CronTrigger(hour=2, minute=0),
+    "weekly": CronTrigger(day_of_week="sun", hour=2, minute=0),
+}
+# Schedule the current backup job was added with
+_applied_schedule = None
 
 
 def init_app(app) -> None:
-    """Start the scheduler and apply the current backup schedule."""
+    """Start the scheduler and join the election for running backups.
+
+    Set ``RUN_SCHEDULER=0`` to keep a process out of the election entirely.
+    """
+    if not app.config.get("RUN_SCHEDULER", True):
+        return
     if not _scheduler.running:
         _scheduler.start()
-    apply_schedule(app)
+    _scheduler.add_job(
+        _sync,
+        trigger=IntervalTrigger(seconds=_SYNC_INTERVAL_SECONDS),
+        id=_SYNC_JOB_ID,
+        args=[app],
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    _sync(app)
 
 
 def apply_schedule(app) -> None:
-    """Update the scheduled backup job to match the current settings."""
+    """Update the scheduled backup job to match the current settings.
+
+    Only the leader holds the backup job. In any other process this is a
+    no-op; the leader picks up the new schedule on its next sync.
+    """
+    global _applied_schedule
+
+    if _leader_conn is None:
+        return
+
     with app.app_context():
         from app.models import Settings
         schedule = Settings.get("backup_schedule", "")
 
-    if _scheduler.get_job(_JOB_ID):
+    job = _scheduler.get_job(_JOB_ID)
+    trigger = _TRIGGERS.get(schedule)
+    # _sync calls this every minute; leave a job that is already current alone
+    if job is None and trigger is None:
+        return
+    if job is not None and schedule == _applied_schedule:
+        return
+
+    if job:
         _scheduler.remove_job(_JOB_ID)
 
-    trigger = _make_trigger(schedule)
     if trigger:
         _scheduler.add_job(
             _run_scheduled_backup,
@@ -38,19 +88,63 @@ def apply_schedule(app) -> None:
             max_instances=1,
             coalesce=True,
         )
+        _applied_schedule = schedule
         logger.info("Backup scheduled: %s", schedule)
     else:
         logger.info("Backup schedule disabled.")
 
 
-def _make_trigger(schedule: str):
-    if schedule == "hourly":
-        return CronTrigger(minute=0)
-    elif schedule == "daily":
-        return CronTrigger(hour=2, minute=0)
-    elif schedule == "weekly":
-        return CronTrigger(day_of_week="sun", hour=2, minute=0)
-    return None
+def _sync(app) -> None:
+    """Re-run the election and reconcile the backup job with the settings."""
+    if _hold_leader_lock(app):
+        apply_schedule(app)
+    elif _scheduler.get_job(_JOB_ID):
+        _scheduler.remove_job(_JOB_ID)
+
+
+def _hold_leader_lock(app) -> bool:
+    """Return True if this process holds (or has just taken) the leader lock."""
+    global _leader_conn
+
+    if _leader_conn is not None:
+        try:
+            _leader_conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            logger.warning("Lost the scheduler leader connection; re-electing.")
+            _close_quietly(_leader_conn)
+            _leader_conn = None
+
+    try:
+        with app.app_context():
+            from app import db
+            conn = db.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+    except Exception:
+        logger.exception("Could not connect for scheduler leader election")
+        return False
+
+    try:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": _LEADER_LOCK_KEY}
+        ).scalar()
+    except Exception:
+        logger.exception("Scheduler leader election failed")
+        acquired = False
+
+    if not acquired:
+        _close_quietly(conn)
+        return False
+
+    _leader_conn = conn
+    logger.info("This process is now the backup scheduler leader.")
+    return True
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
 
 
 def _run_scheduled_backup(app) -> None:
@@ -1,10 +1,13 @@
 import csv
+import io
 import os
 import shutil
 import tempfile
 import threading
+import time
 import zipfile
-from datetime import datetime
+from datetime import date, datetime
+from itertools import islice
 
 from flask import current_app
 from sqlalchemy import text
@@ -14,6 +17,53 @@ from app.models.voter import Voter
 from app.models.voter_import import VoterImport, ImportStatus
 
 
+# Plain GROUP BY (no DISTINCT) so Postgres can hash-aggregate over an
+# index-only scan of idx_voters_city.
+_DISTINCT_CITIES_SQL = text("""
+    SELECT city AS value, INITCAP(city) AS label, COUNT(*) AS count
+    FROM voters
+    WHERE city IS NOT NULL AND city <> ''
+    GROUP BY city
+    ORDER BY count DESC
+""")
+
+
+class _CsvCopyStream(io.TextIOBase):
+    """Read-only text stream that renders voter rows as CSV lines on demand.
+
+    psycopg2's ``copy_expert`` pulls fixed-size reads from it, so only about
+    one read's worth of CSV text exists at a time. In CSV format an unquoted
+    empty field is NULL; the row mapper never emits empty strings, so missing
+    values load as NULL.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        buf = self._buf
+        while size < 0 or buf.tell() < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+
+        data = buf.getvalue()
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+        else:
+            rest = ""
+        buf.seek(0)
+        buf.truncate()
+        buf.write(rest)
+        return data
+
+
 class VoterImportService:
     """Service for importing voter files with progress tracking and rollback support."""
 
@@ -39,13 +89,31 @@ class VoterImportService:
     # Note: Columns starting with GENERAL, SPECIAL, PRIMARY (voting history)
     # are automatically skipped since they're not in COLUMN_MAPPING
 
-    # Batch size for commits and cancellation checks
-    BATCH_SIZE = 1000
+    DATE_FIELDS = ("date_of_birth", "registration_date")
+    # Tried in order after the ISO fast path in _parse_date
+    DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y")
+
+    # Rows per COPY chunk. Each chunk commits together with its progress
+    # update, and cancellation is checked between chunks.
+    BATCH_SIZE = 50_000
 
     # Track running import threads for cancellation
     _running_imports = {}
     _lock = threading.Lock()
 
+    # Advisory lock key class for running imports, locked as (class, id).
+    # The thread running an import holds it for the whole run, so any
+    # Gunicorn worker can tell a live import from one orphaned by a crash.
+    IMPORT_LOCK_CLASS = 0x50514302
+
+    # get_loaded_counties() and get_distinct_cities() results, each
+    # (expires_at, value). Writes in this process clear them; the TTLs cover
+    # imports finished by other workers.
+    _loaded_counties_cache = None
+    LOADED_COUNTIES_TTL = 60
+    _distinct_cities_cache = None
+    DISTINCT_CITIES_TTL = 300
+
     @classmethod
     def count_lines(cls, filepath):
         """Count lines in a file efficiently."""
@@ -72,14 +140,27 @@ class VoterImportService:
     def cancel_import(cls, import_id):
         """Signal cancellation to a running import.
 
-        Returns True if the thread was signalled, False if no thread is running
-        (e.g. the process was killed and restarted).
+        Returns True if the import is still running in this or another worker
+        process, False if nothing is running it (e.g. the process was killed
+        and restarted). A live import sees the request through the
+        ``cancel_requested`` flag, which the caller commits.
         """
         with cls._lock:
             if import_id in cls._running_imports:
                 cls._running_imports[import_id]["cancel"] = True
                 return True
-        return False
+        return cls.is_import_alive(import_id)
+
+    @classmethod
+    def is_import_alive(cls, import_id):
+        """Check whether any process currently holds the lock for an import."""
+        return bool(db.session.execute(text("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_locks
+                WHERE locktype = 'advisory' AND granted
+                  AND classid = :lock_class AND objid = :import_id AND objsubid = 2
+            )
+        """), {"lock_class": cls.IMPORT_LOCK_CLASS, "import_id": import_id}).scalar())
 
     @classmethod
     def force_cancel_import(cls, import_id):
@@ -108,9 +189,14 @@ class VoterImportService:
 
         Called once at app startup.
         """
-        stale = VoterImport.query.filter(
-            VoterImport.status.in_([ImportStatus.RUNNING, ImportStatus.PENDING])
-        ).all()
+        stale = [
+            voter_import
+            for voter_import in VoterImport.query.filter(
+                VoterImport.status.in_([ImportStatus.RUNNING, ImportStatus.PENDING])
+            ).all()
+            # Another worker may be mid-import while this one starts up
+            if not cls.is_import_alive(voter_import.id)
+        ]
 
         for voter_import in stale:
             voter_import.status = ImportStatus.FAILED
@@ -128,13 +214,22 @@ class VoterImportService:
                 except Exception:
                     db.session.rollback()
 
+        # A crashed import may have dropped the voters indexes
+        if stale:
+            try:
+                cls._create_voter_indexes()
+            except Exception:
+                db.session.rollback()
+
     @classmethod
     def _is_cancelled(cls, import_id):
-        """Check if cancellation was requested."""
+        """Check if cancellation was requested, here or via another worker."""
         with cls._lock:
-            if import_id in cls._running_imports:
-                return cls._running_imports[import_id]["cancel"]
-        return False
+            if import_id in cls._running_imports and cls._running_imports[import_id]["cancel"]:
+                return True
+        return bool(db.session.execute(
+            db.select(VoterImport.cancel_requested).where(VoterImport.id == import_id)
+        ).scalar())
 
     @classmethod
     def _cleanup_import(cls, import_id):
@@ -146,75 +241,106 @@ class VoterImportService:
     def _run_import(cls, import_id, app):
         """Execute the import process in a background thread."""
         with app.app_context():
-            voter_import = db.session.get(VoterImport, import_id)
-            if not voter_import:
-                return
-
+            lock_conn = db.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            lock_params = {"lock_class": cls.IMPORT_LOCK_CLASS, "import_id": import_id}
+            lock_conn.execute(text("SELECT pg_advisory_lock(:lock_class, :import_id)"), lock_params)
             try:
-                # Update status to running
-                voter_import.status = ImportStatus.RUNNING
-                voter_import.started_at = datetime.utcnow()
-                db.session.commit()
+                cls._run_locked_import(import_id, app)
+            finally:
+                try:
+                    lock_conn.execute(
+                        text("SELECT pg_advisory_unlock(:lock_class, :import_id)"), lock_params
+                    )
+                finally:
+                    lock_conn.close()
 
-                # Get the file path
-                upload_folder = app.config.get("UPLOAD_FOLDER", "/tmp/petition-qc-uploads")
-                filepath = os.path.join(upload_folder, voter_import.filename)
+    @classmethod
+    def _run_locked_import(cls, import_id, app):
+        """Run an import while holding its advisory lock."""
+        voter_import = db.session.get(VoterImport, import_id)
+        if not voter_import:
+            return
 
-                if not os.path.exists(filepath):
-                    raise FileNotFoundError(f"Upload file not found: {filepath}")
+        indexes_dropped = False
+        try:
+            # Update status to running
+            voter_import.status = ImportStatus.RUNNING
+            voter_import.started_at = datetime.utcnow()
+            db.session.commit()
 
-                # Count total rows for progress tracking
-                voter_import.total_rows = cls.count_lines(filepath)
-                db.session.commit()
+            # Get the file path
+            upload_folder = app.config.get("UPLOAD_FOLDER", "/tmp/petition-qc-uploads")
+            filepath = os.path.join(upload_folder, voter_import.filename)
 
-                # Get county number from the selected county name
-                county_number = cls.get_county_number(voter_import.county_name)
-                if not county_number:
-                    raise ValueError(f"Unknown county: {voter_import.county_name}")
+            if not os.path.exists(filepath):
+                raise FileNotFoundError(f"Upload file not found: {filepath}")
 
-                # Create backup of existing county voters
-                cls._create_backup(voter_import, county_number)
+            # Count total rows for progress tracking
+            voter_import.total_rows = cls.count_lines(filepath)
+            db.session.commit()
 
-                # Delete existing voters for this county
-                cls._delete_county_voters(county_number)
+            # Get county number from the selected county name
+            county_number = cls.get_county_number(voter_import.county_name)
+            if not county_number:
+                raise ValueError(f"Unknown county: {voter_import.county_name}")
 
-                # Import new data
-                cls._import_csv(voter_import, filepath)
+            # Create backup of existing county voters
+            cls._create_backup(voter_import, county_number)
 
-                # Check final status
-                if cls._is_cancelled(import_id):
-                    voter_import.status = ImportStatus.CANCELLED
-                    cls._restore_from_backup(voter_import)
-                else:
-                    voter_import.status = ImportStatus.COMPLETED
-                    voter_import.completed_at = datetime.utcnow()
+            # Delete existing voters for this county
+            cls._delete_county_voters(county_number)
 
-                db.session.commit()
+            # Load into an unindexed table if nothing else is loaded
+            indexes_dropped = cls._drop_voter_indexes_if_empty()
 
-            except Exception as e:
-                db.session.rollback()
-                voter_import = db.session.get(VoterImport, import_id)
-                if voter_import:
-                    voter_import.status = ImportStatus.FAILED
-                    voter_import.error_message = str(e)
-                    voter_import.completed_at = datetime.utcnow()
-                    db.session.commit()
-                    # Restore from backup on error
-                    try:
-                        cls._restore_from_backup(voter_import)
-                    except Exception:
-                        pass  # Best effort restore
+            # Import new data
+            cls._import_csv(voter_import, filepath)
 
-            finally:
-                cls._cleanup_import(import_id)
-                # Clean up the uploaded file
+            # Check final status
+            if cls._is_cancelled(import_id):
+                voter_import.status = ImportStatus.CANCELLED
+                cls._restore_from_backup(voter_import)
+            else:
+                voter_import.status = ImportStatus.COMPLETED
+                voter_import.completed_at = datetime.utcnow()
+
+            db.session.commit()
+
+        except Exception as e:
+            db.session.rollback()
+            voter_import = db.session.get(VoterImport, import_id)
+            if voter_import:
+                voter_import.status = ImportStatus.FAILED
+                voter_import.error_message = str(e)
+                voter_import.completed_at = datetime.utcnow()
+                db.session.commit()
+                # Restore from backup on error
+                try:
+                    cls._restore_from_backup(voter_import)
+                except Exception:
+                    pass  # Best effort restore
+
+        finally:
+            if indexes_dropped:
                 try:
-                    upload_folder = app.config.get("UPLOAD_FOLDER", "/tmp/petition-qc-uploads")
-                    filepath = os.path.join(upload_folder, voter_import.filename)
-                    if os.path.exists(filepath):
-                        os.remove(filepath)
+                    cls._create_voter_indexes()
                 except Exception:
-                    pass
+                    db.session.rollback()
+                    current_app.logger.exception("Failed to rebuild voters indexes")
+            try:
+                cls._vacuum_voters()
+            except Exception:
+                current_app.logger.exception("Failed to vacuum voters after import")
+            cls._cleanup_import(import_id)
+            cls._invalidate_voter_caches()
+            # Clean up the uploaded file
+            try:
+                upload_folder = app.config.get("UPLOAD_FOLDER", "/tmp/petition-qc-uploads")
+                filepath = os.path.join(upload_folder, voter_import.filename)
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+            except Exception:
+                pass
 
     @classmethod
     def _create_backup(cls, voter_import, county_number):
@@ -250,6 +376,53 @@ class VoterImportService:
         )
         db.session.commit()
 
+    @classmethod
+    def _drop_voter_indexes_if_empty(cls):
+        """Drop the voters indexes if the table is empty; return True if dropped.
+
+        Building each index once after the load is far cheaper than keeping
+        the GIN trigram indexes up to date row by row during COPY. This is
+        only done when no other county is loaded, so search never loses its
+        indexes and the rebuild only covers the imported rows.
+        """
+        # Serializes index changes between concurrent imports
+        db.session.execute(
+            text("SELECT pg_advisory_xact_lock(:lock_class, 0)"),
+            {"lock_class": cls.IMPORT_LOCK_CLASS},
+        )
+        if db.session.execute(text("SELECT EXISTS (SELECT 1 FROM voters)")).scalar():
+            db.session.commit()
+            return False
+
+        conn = db.session.connection()
+        for index in Voter.__table__.indexes:
+            index.drop(conn, checkfirst=True)
+        db.session.commit()
+        return True
+
+    @classmethod
+    def _create_voter_indexes(cls):
+        """Create any voters indexes missing from the model's definitions."""
+        db.session.execute(
+            text("SELECT pg_advisory_xact_lock(:lock_class, 0)"),
+            {"lock_class": cls.IMPORT_LOCK_CLASS},
+        )
+        conn = db.session.connection()
+        for index in Voter.__table__.indexes:
+            index.create(conn, checkfirst=True)
+        db.session.commit()
+
+    @classmethod
+    def _vacuum_voters(cls):
+        """VACUUM (ANALYZE) the voters table after an import has rewritten a county.
+
+        Gives the planner statistics for the new rows and marks pages
+        all-visible, so county counts and deletes can be served by
+        index-only scans on ``ix_voters_county_number``.
+        """
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM (ANALYZE) voters"))
+
     @classmethod
     def delete_all_voters(cls):
         """Delete all voters and return the count."""
@@ -258,6 +431,7 @@ class VoterImportService:
 
         db.session.execute(text("DELETE FROM voters"))
         db.session.commit()
+        cls._invalidate_voter_caches()
         return count
 
     @classmethod
@@ -279,13 +453,27 @@ class VoterImportService:
             {"county_number": county_number}
         )
         db.session.commit()
+        cls._invalidate_voter_caches()
         return count
 
+    @classmethod
+    def _invalidate_voter_caches(cls):
+        """Forget cached voter-table summaries after the table changes."""
+        cls._loaded_counties_cache = None
+        cls._distinct_cities_cache = None
+
     @classmethod
     def get_loaded_counties(cls):
-        """Get list of counties that have voters loaded, with counts."""
-        # Reverse mapping: county_number -> county_name
-        number_to_name = {v: k for k, v in cls.OHIO_COUNTY_NUMBERS.items()}
+        """Get list of counties that have voters loaded, with counts.
+
+        Counting groups the whole voters table, so the result is cached for
+        ``LOADED_COUNTIES_TTL`` seconds.
+        """
+        cached = cls._loaded_counties_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        number_to_name = cls.OHIO_COUNTY_NAMES_BY_NUMBER
 
         result = db.session.execute(
             text("SELECT county_number, COUNT(*) as cnt FROM voters GROUP BY county_number ORDER BY county_number")
@@ -302,99 +490,124 @@ class VoterImportService:
                 "count": count
             })
 
+        cls._loaded_counties_cache = (time.monotonic() + cls.LOADED_COUNTIES_TTL, counties)
         return counties
 
     @classmethod
-    def _import_csv(cls, voter_import, filepath):
-        """Stream import a CSV file."""
-        processed = 0
-        batch = []
+    def get_distinct_cities(cls):
+        """Get the cities in the voter file with voter counts, largest first.
 
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                # Check for cancellation every batch
-                if processed % cls.BATCH_SIZE == 0 and processed > 0:
-                    if cls._is_cancelled(voter_import.id):
-                        # Commit what we have and stop
-                        if batch:
-                            cls._insert_batch(batch)
-                            batch = []
-                        voter_import.processed_rows = processed
-                        db.session.commit()
-                        return
-
-                voter_data = cls._map_row(row)
-                if voter_data:
-                    batch.append(voter_data)
-
-                processed += 1
-
-                # Commit batch
-                if len(batch) >= cls.BATCH_SIZE:
-                    cls._insert_batch(batch)
-                    batch = []
-                    voter_import.processed_rows = processed
-                    db.session.commit()
-
-            # Insert remaining batch
-            if batch:
-                cls._insert_batch(batch)
-                voter_import.processed_rows = processed
-                db.session.commit()
+        The list only changes when voters are loaded or deleted, so it is
+        cached for ``DISTINCT_CITIES_TTL`` seconds.
+        """
+        cached = cls._distinct_cities_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        result = db.session.execute(_DISTINCT_CITIES_SQL)
+
+        cities = [row._asdict() for row in result]
+
+        cls._distinct_cities_cache = (time.monotonic() + cls.DISTINCT_CITIES_TTL, cities)
+        return cities
 
     @classmethod
-    def _map_row(cls, row):
-        """Map a CSV row to voter data dict."""
-        voter_data = {}
-
-        for csv_col, model_field in cls.COLUMN_MAPPING.items():
-            value = row.get(csv_col, "").strip() if row.get(csv_col) else None
-            if value:
-                # Handle date fields
-                if model_field in ("date_of_birth", "registration_date"):
-                    try:
-                        # Try common date formats
-                        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
-                            try:
-                                value = datetime.strptime(value, fmt).date()
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            value = None
-                    except Exception:
-                        value = None
-                voter_data[model_field] = value
-
-        # Must have at least sos_voterid or county_number
-        if not voter_data.get("sos_voterid") and not voter_data.get("county_number"):
-            return None
-
-        return voter_data
+    def _import_csv(cls, voter_import, filepath):
+        """Stream import a CSV file in COPY chunks of ``BATCH_SIZE`` rows."""
+        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            map_row = cls._row_mapper(header)
+
+            while not cls._is_cancelled(voter_import.id):
+                lines_before = reader.line_num
+                cls._insert_batch(
+                    voter_data
+                    for voter_data in map(map_row, islice(reader, cls.BATCH_SIZE))
+                    if voter_data
+                )
+                if reader.line_num == lines_before:
+                    break
+
+                # line_num counts physical lines, like count_lines() does for
+                # total_rows, so progress ends at exactly 100%.
+                voter_import.processed_rows = max(0, reader.line_num - 1)
+                db.session.commit()
 
     @classmethod
-    def _insert_batch(cls, batch):
-        """Bulk insert a batch of voter records."""
-        if not batch:
-            return
+    def _row_mapper(cls, header):
+        """Build a function mapping a raw CSV row to a COPY row.
 
-        # Collect all columns from all records in the batch
-        all_columns = set()
-        for record in batch:
-            all_columns.update(record.keys())
-        columns = sorted(all_columns)
+        Column positions are resolved from *header* once, so each row is a
+        list of values in ``COLUMN_MAPPING`` order rather than a dict keyed
+        by every column in the file. The function returns None for rows with
+        neither a voter ID nor a county number.
+        """
+        # Later duplicates win, as with csv.DictReader
+        index = {name: i for i, name in enumerate(header)}
+        fields = list(cls.COLUMN_MAPPING.values())
+        positions = [index.get(csv_col) for csv_col in cls.COLUMN_MAPPING]
+        date_slots = {i for i, field in enumerate(fields) if field in cls.DATE_FIELDS}
+        id_slot = fields.index("sos_voterid")
+        county_slot = fields.index("county_number")
+        # Stored upper-case, like the target city and registered_city
+        city_slot = fields.index("city")
+        parse_date = cls._parse_date
+
+        def map_row(row):
+            width = len(row)
+            values = []
+            for slot, pos in enumerate(positions):
+                value = row[pos].strip() if pos is not None and pos < width else None
+                if not value:
+                    value = None
+                elif slot in date_slots:
+                    value = parse_date(value)
+                elif slot == city_slot:
+                    value = value.upper()
+                values.append(value)
+
+            # Must have at least sos_voterid or county_number
+            if not values[id_slot] and not values[county_slot]:
+                return None
+            return values
+
+        return map_row
 
-        placeholders = ", ".join([f":{col}" for col in columns])
-        column_names = ", ".join(columns)
+    @classmethod
+    def _parse_date(cls, value):
+        """Parse a voter-file date, or return None if no known format matches."""
+        # date.fromisoformat is far cheaper than strptime for the common case
+        if len(value) == 10 and value[4] == "-":
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        for fmt in cls.DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        return None
 
-        sql = text(f"INSERT INTO voters ({column_names}) VALUES ({placeholders})")
+    @classmethod
+    def _insert_batch(cls, batch):
+        """Bulk load voter records with COPY FROM STDIN.
 
-        for voter_data in batch:
-            # Ensure all columns have a value (None for missing)
-            complete_data = {col: voter_data.get(col) for col in columns}
-            db.session.execute(sql, complete_data)
+        *batch* may be any iterable of value lists in ``COLUMN_MAPPING``
+        order; rows are rendered as CSV only as Postgres reads them. Runs on the session's own connection
+        so the rows commit (or roll back) together with the progress update
+        in ``_import_csv``.
+        """
+        columns = list(cls.COLUMN_MAPPING.values())
+        dbapi_conn = db.session.connection().connection.dbapi_connection
+        with dbapi_conn.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY voters ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)",
+                _CsvCopyStream(batch),
+            )
 
     @classmethod
     def rollback_import(cls, import_id):
@@ -454,6 +667,7 @@ class VoterImportService:
         """))
 
         db.session.commit()
+        cls._invalidate_voter_caches()
 
     @classmethod
     def cleanup_backup(cls, import_id):
@@ -549,11 +763,13 @@ class VoterImportService:
         "Van Wert": "81", "Vinton": "82", "Warren": "83", "Washington": "84", "Wayne": "85",
         "Williams": "86", "Wood": "87", "Wyandot": "88",
     }
+    OHIO_COUNTY_NAMES = tuple(OHIO_COUNTY_NUMBERS)
+    OHIO_COUNTY_NAMES_BY_NUMBER = {v: k for k, v in OHIO_COUNTY_NUMBERS.items()}
 
     @classmethod
     def get_ohio_counties(cls):
-        """Get list of all Ohio county names."""
-        return list(cls.OHIO_COUNTY_NUMBERS.keys())
+        """Get all Ohio county names (a constant tuple)."""
+        return cls.OHIO_COUNTY_NAMES
 
     @classmethod
     def get_county_number(cls, county_name):
@@ -1,17 +1,10 @@
 #!/bin/sh
 set -e
 
-echo "Enabling pg_trgm extension..."
-python - <<'PYEOF'
-import os, psycopg2
-conn = psycopg2.connect(os.environ["DATABASE_URL"])
-conn.autocommit = True
-conn.cursor().execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
-conn.close()
-PYEOF
-
 # Detect whether this is a brand-new database (no alembic_version table yet).
-# Fresh installs use db.create_all() + stamp; existing installs use migrate.
+# Fresh installs use `flask db-init` + stamp; existing installs use migrate.
+# Both paths enable pg_trgm themselves (db-init, and the trigram migration),
+# so booting an up-to-date database never touches the extension catalog.
 FRESH_DB=$(python - <<'PYEOF'
 import os, psycopg2
 conn = psycopg2.connect(os.environ["DATABASE_URL"])
@@ -28,13 +21,8 @@ PYEOF
 )
 
 if [ "$FRESH_DB" = "1" ]; then
-    echo "Fresh database detected — creating tables with db.create_all()..."
-    python - <<'PYEOF'
-from app import create_app, db
-app = create_app()
-with app.app_context():
-    db.create_all()
-PYEOF
+    echo "Fresh database detected — creating tables with flask db-init..."
+    flask db-init
     echo "Stamping migrations as current..."
     flask db stamp head
 else
@@ -72,5 +60,6 @@ exec gunicorn \
     --workers 4 \
     --bind 0.0.0.0:8000 \
     --timeout 3600 \
-    --worker-class sync \
+    --worker-class gthread \
+    --threads 4 \
     "app:create_app()"
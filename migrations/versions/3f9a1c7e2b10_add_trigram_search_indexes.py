@@ -0,0 +1,47 @@
+"""Add trigram search indexes on voters and signatures
+
+Revision ID: 3f9a1c7e2b10
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7e2b10'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+# Created by scripts/create_indexes.py on older installs; ensured here.
+EXISTING_INDEXES = [
+    ('idx_voters_address_trgm', 'voters', 'residential_address1'),
+    ('idx_voters_name_trgm', 'voters', 'last_name'),
+]
+
+NEW_INDEXES = [
+    ('idx_voters_first_name_trgm', 'voters', 'first_name'),
+    ('idx_voters_city_trgm', 'voters', 'residential_city'),
+    ('idx_signatures_registered_city_trgm', 'signatures', 'registered_city'),
+]
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CONCURRENTLY avoids locking the voters table against writes while the
+    # GIN indexes build, but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, column in EXISTING_INDEXES + NEW_INDEXES:
+            create_index_concurrently(name, f'{table} USING gin ({column} gin_trgm_ops)')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in NEW_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
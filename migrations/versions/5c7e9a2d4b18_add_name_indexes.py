@@ -0,0 +1,37 @@
+"""Add (last_name, first_name) indexes on collectors and data enterers
+
+Revision ID: 5c7e9a2d4b18
+Revises: 8d2e4b6f1a93
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '5c7e9a2d4b18'
+down_revision = '8d2e4b6f1a93'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_collectors_name', 'collectors'),
+    ('ix_data_enterers_name', 'data_enterers'),
+]
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            create_index_concurrently(name, f'{table} (last_name, first_name)')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
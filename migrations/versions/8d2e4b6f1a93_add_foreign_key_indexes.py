@@ -0,0 +1,41 @@
+"""Add indexes on batch and signature foreign keys
+
+Revision ID: 8d2e4b6f1a93
+Revises: 3f9a1c7e2b10
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4b6f1a93'
+down_revision = '3f9a1c7e2b10'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_batches_book_id', 'batches (book_id)'),
+    ('ix_batches_collector_id', 'batches (collector_id)'),
+    ('ix_batches_enterer_date', 'batches (enterer_id, date_entered)'),
+    ('ix_signatures_batch_id', 'signatures (batch_id)'),
+    ('ix_signatures_book_matched', 'signatures (book_id, matched)'),
+]
+
+
+def upgrade():
+    # CONCURRENTLY keeps signature entry unblocked while the indexes build,
+    # but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, on in INDEXES:
+            create_index_concurrently(name, on)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
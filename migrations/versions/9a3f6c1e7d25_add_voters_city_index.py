@@ -0,0 +1,32 @@
+"""Add partial index on voters.city
+
+Revision ID: 9a3f6c1e7d25
+Revises: 5c7e9a2d4b18
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3f6c1e7d25'
+down_revision = '5c7e9a2d4b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids blocking voter imports while the index builds, but
+    # cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            'idx_voters_city', "voters (city) WHERE city IS NOT NULL AND city <> ''"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_voters_city')
@@ -0,0 +1,32 @@
+"""Add partial index on matched signatures
+
+Revision ID: b4e8d2a6c3f7
+Revises: 9a3f6c1e7d25
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e8d2a6c3f7'
+down_revision = '9a3f6c1e7d25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY keeps signature entry unblocked while the index builds,
+    # but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            'ix_signatures_matched_book_id', 'signatures (book_id, id) WHERE matched = TRUE'
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_signatures_matched_book_id')
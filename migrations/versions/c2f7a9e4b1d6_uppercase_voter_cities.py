@@ -0,0 +1,28 @@
+"""Store voters.city upper-case
+
+Revision ID: c2f7a9e4b1d6
+Revises: b4e8d2a6c3f7
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f7a9e4b1d6'
+down_revision = 'b4e8d2a6c3f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Imports now upper-case city; bring rows loaded earlier in line so each
+    # city groups under one spelling. SOS files are already upper-case, so
+    # this usually updates nothing.
+    op.execute('UPDATE voters SET city = UPPER(city) WHERE city <> UPPER(city)')
+
+
+def downgrade():
+    # Original casing is not recoverable; upper-case values remain valid.
+    pass
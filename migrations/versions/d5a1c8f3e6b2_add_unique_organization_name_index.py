@@ -0,0 +1,38 @@
+"""Add unique index on organizations.name
+
+Revision ID: d5a1c8f3e6b2
+Revises: c2f7a9e4b1d6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_helpers import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a1c8f3e6b2'
+down_revision = 'c2f7a9e4b1d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The routes used to check for an existing name before saving; the index
+    # enforces it instead. Names were already unique unless two saves raced,
+    # so rename any such duplicates first rather than fail the upgrade: the
+    # oldest row keeps the name and the others get their id appended.
+    op.execute(
+        "UPDATE organizations AS dup SET name = dup.name || ' (' || dup.id || ')' "
+        'FROM organizations AS kept '
+        'WHERE kept.name = dup.name AND kept.id < dup.id'
+    )
+
+    with op.get_context().autocommit_block():
+        create_index_concurrently('ix_organizations_name', 'organizations (name)', unique=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_organizations_name')
@@ -0,0 +1,44 @@
+"""Backfill the stored backup key fingerprint
+
+Revision ID: f3b9d1a7c5e2
+Revises: d5a1c8f3e6b2
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d1a7c5e2'
+down_revision = 'd5a1c8f3e6b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Fingerprints are computed when a key is saved; a key saved before
+    # they were stored gets its fingerprint here, once.
+    conn = op.get_bind()
+    values = dict(conn.execute(sa.text(
+        "SELECT key, value FROM settings "
+        "WHERE key IN ('backup_scp_key_content', 'backup_scp_key_fingerprint')"
+    )).all())
+    key_content = values.get('backup_scp_key_content')
+    if not key_content or values.get('backup_scp_key_fingerprint'):
+        return
+
+    from app.services.backup import key_fingerprint
+
+    conn.execute(
+        sa.text(
+            "INSERT INTO settings (key, value) VALUES ('backup_scp_key_fingerprint', :value) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value, updated_at = now()"
+        ),
+        {'value': key_fingerprint(key_content)},
+    )
+
+
+def downgrade():
+    # The fingerprint stays valid for the stored key.
+    pass